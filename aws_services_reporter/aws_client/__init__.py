@@ -1,28 +1,43 @@
 """AWS client modules for service data fetching.
 
 Contains AWS API interactions, session management, and data fetching utilities.
+Submodules are imported lazily on first attribute access, so importing the
+package does not pull in boto3 until AWS functionality is actually used.
 """
 
-from .session import create_session
-from .ssm_client import (
-    get_all_parameters_by_path,
-    get_all_regions_and_names,
-    get_all_services,
-    get_all_services_with_names,
-    get_region_details,
-    get_service_name,
-    get_services_per_region,
-    get_services_per_region_enhanced,
-)
-
-__all__ = [
-    "create_session",
-    "get_all_parameters_by_path",
-    "get_region_details",
-    "get_all_regions_and_names",
-    "get_services_per_region",
-    "get_services_per_region_enhanced",
-    "get_all_services",
-    "get_all_services_with_names",
-    "get_service_name",
-]
+import importlib
+from typing import Any, List
+
+# Maps each public name to the submodule that defines it
+_LAZY_IMPORTS = {
+    "create_session": "session",
+    "get_all_parameters_by_path": "ssm_client",
+    "get_region_details": "ssm_client",
+    "get_region_attributes": "ssm_client",
+    "get_az_count": "ssm_client",
+    "get_all_regions_and_names": "ssm_client",
+    "get_services_per_region": "ssm_client",
+    "get_services_per_region_enhanced": "ssm_client",
+    "get_all_services": "ssm_client",
+    "get_all_services_with_names": "ssm_client",
+    "get_service_name": "ssm_client",
+    "get_service_names": "ssm_client",
+    "build_enhanced_services": "ssm_client",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public names from their submodules on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
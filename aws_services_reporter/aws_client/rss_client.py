@@ -5,84 +5,228 @@ documentation RSS feed to supplement SSM Parameter Store data with additional
 context and potentially more accurate launch information.
 """
 
+import io
+import json
 import logging
+import os
 import re
-from datetime import datetime
-from typing import Dict, Optional
-
-try:
-    import defusedxml.ElementTree as ET
-except ImportError:
-    import warnings
-    import xml.etree.ElementTree as ET  # nosec B405
-
-    warnings.warn(
-        "defusedxml not available, using xml.etree.ElementTree. "
-        "Install defusedxml for improved security: pip install defusedxml"
-    )
+import urllib.error
+import urllib.request
+import warnings
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import urlsplit
 
-try:
-    import requests
-except ImportError:
-    import urllib.error
-    import urllib.request
-    import warnings
+from ..core.config import Config
 
-    warnings.warn(
-        "requests not available, using urllib. "
-        "Install requests for improved security: pip install requests"
-    )
+logger = logging.getLogger(__name__)
 
-from ..core.config import Config
+# Optional dependencies are resolved on first use (see _get_et/_get_http_session)
+# so importing this module stays cheap when RSS data is never fetched
+_ET: Any = None
+_SESSION: Any = None
+_HTTP_RESOLVED = False
 
+# Single precompiled pattern covering standard (us-east-1) and extended
+# (ap-southeast-1) region code formats; one search scans the text once
+_REGION_RE = re.compile(r"\b(?P<code>[a-z]{2}-[a-z]+\d?-\d+)\b", re.IGNORECASE)
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+_NO_STORE_RE = re.compile(r"\bno-store\b", re.IGNORECASE)
+_NO_CACHE_RE = re.compile(r"\bno-cache\b", re.IGNORECASE)
 
-def fetch_rss_data(rss_url: str, timeout: int = 30) -> Optional[str]:
-    """Fetch RSS feed data from URL with error handling.
+# RSS pubDates are RFC 2822, but some feeds carry ISO 8601 values instead
+_DATE_PARSERS = (parsedate_to_datetime, datetime.fromisoformat)
+
+# Shared read-only result for regions with no launch date from any source
+_UNKNOWN_LAUNCH_DATA: Mapping[str, str] = MappingProxyType(
+    {
+        "launch_date": "Unknown",
+        "source": "Unknown",
+        "formatted_date": "",
+        "announcement_url": "",
+    }
+)
+
+# Official AWS regions RSS feed
+RSS_FEED_URL = (
+    "https://docs.aws.amazon.com/global-infrastructure/latest/regions/regions.rss"
+)
+
+# Stored alongside the main data cache (see Config.cache_file)
+RSS_CACHE_FILENAME = "rss_launch_dates_cache.json"
+
+
+def _get_et() -> Any:
+    """Resolve the ElementTree implementation, preferring defusedxml.
+
+    Returns:
+        defusedxml.ElementTree if installed, else xml.etree.ElementTree
+    """
+    global _ET
+    if _ET is None:
+        try:
+            import defusedxml.ElementTree as et_module
+        except ImportError:
+            import xml.etree.ElementTree as et_module  # nosec B405
+
+            warnings.warn(
+                "defusedxml not available, using xml.etree.ElementTree. "
+                "Install defusedxml for improved security: pip install defusedxml"
+            )
+        _ET = et_module
+    return _ET
+
+
+def _get_http_session() -> Any:
+    """Resolve the shared requests session used for RSS fetches.
+
+    The session is created once so repeated fetches reuse pooled keep-alive
+    connections.
+
+    Returns:
+        requests.Session instance, or None if requests is unavailable
+    """
+    global _SESSION, _HTTP_RESOLVED
+    if _SESSION is None and not _HTTP_RESOLVED:
+        try:
+            import requests
+
+            _SESSION = requests.Session()
+            _SESSION.headers.update({"User-Agent": "AWS-Services-Reporter/1.4.1"})
+        except ImportError:
+            warnings.warn(
+                "requests not available, using urllib. "
+                "Install requests for improved security: pip install requests"
+            )
+        _HTTP_RESOLVED = True
+    return _SESSION
+
+
+def fetch_rss_feed(
+    rss_url: str,
+    timeout: int = 30,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Fetch RSS feed from URL, revalidating against cached validators if given.
 
     Args:
         rss_url: URL of the RSS feed to fetch
         timeout: Request timeout in seconds
+        etag: ETag from a previous response, sent as If-None-Match
+        last_modified: Last-Modified from a previous response, sent as
+            If-Modified-Since
 
     Returns:
-        Raw RSS XML content as string, or None if fetch fails
-
-    Raises:
-        Exception: If network request fails or other errors occur
+        Dictionary with response details, or None if fetch fails:
+        {
+            'status': 200 | 304,
+            'data': b'<rss>...</rss>' (b'' when not modified),
+            'etag': '"abc123"' or None,
+            'last_modified': 'Fri, 25 Aug 2006 12:00:00 GMT' or None,
+            'max_age': 3600 or None (0 when Cache-Control has no-cache),
+            'no_store': True when Cache-Control has no-store
+        }
     """
-    logger = logging.getLogger(__name__)
-
     # Validate URL scheme for security
-    if not rss_url.startswith(("https://", "http://")):
+    url_parts = urlsplit(rss_url)
+    if url_parts.scheme not in ("http", "https") or not url_parts.netloc:
         logger.error(f"Invalid URL scheme, only HTTP/HTTPS allowed: {rss_url}")
         return None
+    rss_url = url_parts.geturl()
+
+    request_headers = {}
+    if etag:
+        request_headers["If-None-Match"] = etag
+    if last_modified:
+        request_headers["If-Modified-Since"] = last_modified
 
     try:
-        logger.debug(f"Fetching RSS data from {rss_url}")
+        logger.debug("Fetching RSS data from %s", rss_url)
 
         # Use requests if available for better security
-        if "requests" in globals():
-            response = requests.get(
-                rss_url,
-                timeout=timeout,
-                headers={"User-Agent": "AWS-Services-Reporter/1.4.1"},
+        http_session = _get_http_session()
+        if http_session is not None:
+            response = http_session.get(
+                rss_url, timeout=timeout, headers=request_headers
             )
-            response.raise_for_status()
-            data = response.text
+            status = response.status_code
+            if status != 304:
+                response.raise_for_status()
+            # Raw bytes: the XML parser decodes per the document's declaration
+            data = response.content if status != 304 else b""
+            response_headers = response.headers
         else:
             # Fallback to urllib with validation (URL scheme validated above)
-            with urllib.request.urlopen(
-                rss_url, timeout=timeout
-            ) as response:  # nosec B310
-                data = response.read().decode("utf-8")
+            request = urllib.request.Request(rss_url, headers=request_headers)
+            try:
+                with urllib.request.urlopen(
+                    request, timeout=timeout
+                ) as response:  # nosec B310
+                    status = response.status
+                    data = response.read()
+                    response_headers = response.headers
+            except urllib.error.HTTPError as e:
+                if e.code != 304:
+                    raise
+                status, data, response_headers = 304, b"", e.headers
+
+        if status == 304:
+            logger.info("RSS feed not modified since last fetch")
+        else:
+            logger.info("Successfully fetched RSS data (%d bytes)", len(data))
 
-        logger.info(f"Successfully fetched RSS data ({len(data)} bytes)")
-        return data
+        cache_control = response_headers.get("Cache-Control", "")
+        max_age_match = _MAX_AGE_RE.search(cache_control)
+        if _NO_CACHE_RE.search(cache_control):
+            # no-cache allows storing but requires revalidation on every use
+            max_age = 0
+        else:
+            max_age = int(max_age_match.group(1)) if max_age_match else None
+        return {
+            "status": status,
+            "data": data,
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "max_age": max_age,
+            "no_store": bool(_NO_STORE_RE.search(cache_control)),
+        }
 
     except Exception as e:
         logger.error(f"Failed to fetch RSS feed: {e}")
         return None
 
 
+def fetch_rss_data(rss_url: str, timeout: int = 30) -> Optional[str]:
+    """Fetch RSS feed data from URL with error handling.
+
+    Args:
+        rss_url: URL of the RSS feed to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        Raw RSS XML content as string, or None if fetch fails
+    """
+    response = fetch_rss_feed(rss_url, timeout)
+    return response["data"].decode("utf-8") if response else None
+
+
+def close_rss_session() -> None:
+    """Close the shared HTTP session used for RSS fetches.
+
+    Releases pooled connections; a later fetch creates a new session. Safe
+    to call when requests is unavailable or no session was created.
+    """
+    global _SESSION, _HTTP_RESOLVED
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+        _HTTP_RESOLVED = False
+
+
 def extract_region_code_from_description(description: str) -> Optional[str]:
     """Extract AWS region code from RSS item description.
 
@@ -94,27 +238,34 @@ def extract_region_code_from_description(description: str) -> Optional[str]:
     Returns:
         Region code (e.g., 'us-east-1') if found, None otherwise
     """
-    # Common patterns for region codes in RSS descriptions
-    patterns = [
-        r"\b([a-z]{2}-[a-z]+-\d+)\b",  # Standard format: us-east-1, eu-west-1
-        r"\b([a-z]{2}-[a-z]+[a-z]-\d+)\b",  # Extended format: ap-southeast-1
-        r"region\s+([a-z]{2}-[a-z]+-\d+)",  # "region us-east-1"
-        r"AWS\s+([a-z]{2}-[a-z]+-\d+)",  # "AWS us-east-1"
-    ]
+    match = _REGION_RE.search(description)
+    return match.group("code").lower() if match else None
 
-    for pattern in patterns:
-        match = re.search(pattern, description, re.IGNORECASE)
-        if match:
-            return match.group(1).lower()
 
-    return None
+def _parse_pub_date(pub_date: str) -> str:
+    """Parse an RSS publication date into an ISO date string.
 
+    Tries each parser in _DATE_PARSERS in order and returns on first success.
 
-def parse_rss_launch_dates(rss_data: str) -> Dict[str, Dict[str, str]]:
+    Args:
+        pub_date: Publication date text, e.g. 'Fri, 25 Aug 2006 12:00:00 GMT'
+
+    Returns:
+        Date in YYYY-MM-DD format, or 'Unknown' if no parser accepts it
+    """
+    for parser in _DATE_PARSERS:
+        try:
+            return parser(pub_date).strftime("%Y-%m-%d")
+        except (TypeError, ValueError):
+            continue
+    return "Unknown"
+
+
+def parse_rss_launch_dates(rss_data: Union[str, bytes]) -> Dict[str, Dict[str, str]]:
     """Parse RSS feed and extract region launch dates.
 
     Args:
-        rss_data: Raw RSS XML content
+        rss_data: Raw RSS XML content, as fetched bytes or decoded text
 
     Returns:
         Dictionary mapping region codes to launch information:
@@ -131,69 +282,77 @@ def parse_rss_launch_dates(rss_data: str) -> Dict[str, Dict[str, str]]:
         ET.ParseError: If XML parsing fails
         Exception: For other parsing errors
     """
-    logger = logging.getLogger(__name__)
+    ET = _get_et()
 
     try:
-        # defusedxml preferred, fallback has warning above for user awareness
-        root = ET.fromstring(rss_data)  # nosec B314
-        regions_data = {}
+        if isinstance(rss_data, str):
+            rss_data = rss_data.encode("utf-8")
 
-        # Find all RSS items
-        items = root.findall(".//item")
-        logger.info(f"Processing {len(items)} RSS items")
+        regions_data = {}
+        item_count = 0
 
-        for item in items:
-            title_elem = item.find("title")
-            description_elem = item.find("description")
-            link_elem = item.find("link")
-            pub_date_elem = item.find("pubDate")
+        # Bind hot-loop lookups to locals
+        extract_region_code = extract_region_code_from_description
 
-            if title_elem is None or description_elem is None or pub_date_elem is None:
+        # Stream RSS items so only one <item> subtree is held in memory at a time
+        # defusedxml preferred, fallback has warning above for user awareness
+        for _, item in ET.iterparse(  # nosec B314
+            io.BytesIO(rss_data), events=("end",)
+        ):
+            if item.tag != "item":
+                continue
+            item_count += 1
+
+            # Collect child fields in a single pass instead of one find() per tag
+            fields = {}
+            for child in item:
+                if child.tag not in fields:
+                    fields[child.tag] = child.text or ""
+            item.clear()
+
+            if (
+                "title" not in fields
+                or "description" not in fields
+                or "pubDate" not in fields
+            ):
                 continue
 
-            title = title_elem.text or ""
-            description = description_elem.text or ""
-            link = link_elem.text or "" if link_elem is not None else ""
-            pub_date = pub_date_elem.text or ""
+            title = fields["title"]
+            description = fields["description"]
 
-            # Extract region code from description
-            region_code = extract_region_code_from_description(description)
+            # Extract region code from description, with title as backup; skip
+            # items without one before doing any date parsing
+            region_code = extract_region_code(description) or extract_region_code(title)
             if not region_code:
-                # Try to extract from title as backup
-                region_code = extract_region_code_from_description(title)
-
-            if region_code:
-                # Parse publication date
-                try:
-                    # RSS dates are typically in RFC 2822 format
-                    # Example: "Fri, 25 Aug 2006 12:00:00 GMT"
-                    parsed_date = datetime.strptime(
-                        pub_date, "%a, %d %b %Y %H:%M:%S %Z"
-                    )
-                    iso_date = parsed_date.strftime("%Y-%m-%d")
-                except ValueError:
-                    # Fallback for different date formats
-                    try:
-                        parsed_date = datetime.strptime(
-                            pub_date, "%a, %d %b %Y %H:%M:%S %z"
-                        )
-                        iso_date = parsed_date.strftime("%Y-%m-%d")
-                    except ValueError:
-                        logger.warning(
-                            f"Could not parse date '{pub_date}' for region {region_code}"
-                        )
-                        iso_date = "Unknown"
-
-                regions_data[region_code] = {
-                    "launch_date": iso_date,
-                    "formatted_date": pub_date,
-                    "announcement_title": title.strip(),
-                    "announcement_url": link.strip(),
-                }
-
-                logger.debug(f"Parsed region {region_code}: {iso_date} - {title}")
-
-        logger.info(f"Successfully parsed {len(regions_data)} regions from RSS feed")
+                continue
+
+            link = fields.get("link", "")
+            pub_date = fields["pubDate"]
+
+            iso_date = _parse_pub_date(pub_date)
+            if iso_date == "Unknown":
+                logger.warning(
+                    f"Could not parse date '{pub_date}' for region {region_code}"
+                )
+
+            regions_data[region_code] = {
+                "launch_date": iso_date,
+                "formatted_date": pub_date,
+                "announcement_title": title.strip(),
+                "announcement_url": link.strip(),
+            }
+
+            # Lazy %-formatting: no string is built unless debug is enabled
+            logger.debug("Parsed region %s: %s - %s", region_code, iso_date, title)
+
+        if not item_count:
+            logger.info("RSS feed contained no items")
+            return regions_data
+
+        logger.info(
+            f"Successfully parsed {len(regions_data)} regions "
+            f"from {item_count} RSS items"
+        )
         return regions_data
 
     except ET.ParseError as e:
@@ -204,11 +363,127 @@ def parse_rss_launch_dates(rss_data: str) -> Dict[str, Dict[str, str]]:
         raise
 
 
+def _get_rss_cache_file(config: Config) -> Path:
+    """Get path of the RSS cache file next to the main data cache.
+
+    Args:
+        config: Configuration object with output and cache settings
+
+    Returns:
+        Path to the RSS cache file
+    """
+    return Path(config.output_dir) / Path(config.cache_file).parent / RSS_CACHE_FILENAME
+
+
+def _load_rss_cache(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Load cached RSS launch dates and HTTP validators from disk.
+
+    Args:
+        cache_file: Path to the RSS cache file
+
+    Returns:
+        Cache entry dictionary, or None if missing or unreadable
+    """
+    if not cache_file.exists():
+        return None
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache_entry = json.load(f)
+
+        if "expires_at" not in cache_entry or "regions_data" not in cache_entry:
+            logger.warning("RSS cache file missing required fields")
+            return None
+
+        # Validate timestamp up front so callers can compare it safely
+        datetime.fromisoformat(cache_entry["expires_at"])
+        return cache_entry
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        logger.warning(f"RSS cache file corrupted: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Error loading RSS cache: {e}")
+        return None
+
+
+def _save_rss_cache(
+    cache_file: Path,
+    response: Dict[str, Any],
+    regions_data: Dict[str, Dict[str, str]],
+    default_max_age: int,
+) -> None:
+    """Save RSS launch dates with HTTP validators and expiry to disk.
+
+    Args:
+        cache_file: Path to the RSS cache file
+        response: Response details returned by fetch_rss_feed
+        regions_data: Parsed region launch dates to cache
+        default_max_age: Freshness lifetime in seconds when the server sends no
+            Cache-Control max-age
+    """
+    max_age = response["max_age"]
+    if max_age is None:
+        max_age = default_max_age
+    expires_at = datetime.now() + timedelta(seconds=max_age)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file in the same directory and swap it in, so a
+        # crash or concurrent run never leaves a truncated cache behind
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "etag": response["etag"],
+                        "last_modified": response["last_modified"],
+                        "expires_at": expires_at.isoformat(),
+                        "regions_data": regions_data,
+                    },
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp_file, cache_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+        logger.debug("Saved RSS cache to %s", cache_file)
+    except Exception as e:
+        logger.warning(f"Error saving RSS cache: {e}")
+
+
+def clear_rss_cache(config: Config) -> bool:
+    """Remove the RSS launch date cache file from disk.
+
+    Args:
+        config: Configuration object with output and cache settings
+
+    Returns:
+        True if the cache was removed or didn't exist, False on error
+    """
+    cache_file = _get_rss_cache_file(config)
+    try:
+        if cache_file.exists():
+            cache_file.unlink()
+            logger.info("RSS cache cleared")
+        return True
+    except Exception as e:
+        logger.error(f"Error clearing RSS cache: {e}")
+        return False
+
+
 def get_rss_region_launch_dates(config: Config) -> Dict[str, Dict[str, str]]:
     """Fetch and parse AWS region launch dates from official RSS feed.
 
+    When caching is enabled, parsed results are stored on disk together with the
+    feed's ETag/Last-Modified validators. Fresh entries (per Cache-Control
+    max-age, or config.cache_hours by default) are returned without any network
+    access; stale entries are revalidated with a conditional GET and reused on
+    304 Not Modified. Responses marked no-cache are stored already stale, and
+    responses marked no-store are not cached at all.
+
     Args:
-        config: Configuration object (for potential future RSS URL customization)
+        config: Configuration object with cache settings
 
     Returns:
         Dictionary mapping region codes to launch date information
@@ -216,36 +491,62 @@ def get_rss_region_launch_dates(config: Config) -> Dict[str, Dict[str, str]]:
     Raises:
         Exception: If RSS fetching or parsing fails completely
     """
-    logger = logging.getLogger(__name__)
+    logger.info("Fetching AWS region launch dates from RSS feed")
 
-    # Official AWS regions RSS feed
-    rss_url = (
-        "https://docs.aws.amazon.com/global-infrastructure/latest/regions/regions.rss"
-    )
+    cache_file = _get_rss_cache_file(config) if config.cache_enabled else None
+    cache_entry = _load_rss_cache(cache_file) if cache_file else None
 
-    logger.info("Fetching AWS region launch dates from RSS feed")
+    if cache_entry:
+        expires_at = datetime.fromisoformat(cache_entry["expires_at"])
+        if expires_at > datetime.now():
+            logger.info("Using cached RSS launch dates")
+            return cache_entry["regions_data"]
 
-    # Fetch RSS data
-    rss_data = fetch_rss_data(rss_url)
-    if not rss_data:
+    # Fetch RSS data, revalidating any stale cache entry
+    response = fetch_rss_feed(
+        RSS_FEED_URL,
+        etag=cache_entry.get("etag") if cache_entry else None,
+        last_modified=cache_entry.get("last_modified") if cache_entry else None,
+    )
+    if response and response["status"] != 304 and not response["data"].strip():
+        # Treat an empty body as a failed fetch: nothing to parse, and it must
+        # not overwrite a good cache entry
+        logger.warning("RSS feed returned an empty response")
+        response = None
+    if not response:
+        if cache_entry:
+            logger.warning("Failed to fetch RSS data, using stale cached results")
+            return cache_entry["regions_data"]
         logger.warning("Failed to fetch RSS data, returning empty results")
         return {}
 
-    # Parse launch dates
-    try:
-        regions_data = parse_rss_launch_dates(rss_data)
-        logger.info(
-            f"Successfully extracted launch dates for {len(regions_data)} regions"
-        )
-        return regions_data
-    except Exception as e:
-        logger.error(f"Failed to parse RSS data: {e}")
-        return {}
+    if response["status"] == 304 and cache_entry:
+        regions_data = cache_entry["regions_data"]
+    else:
+        # Parse launch dates
+        try:
+            regions_data = parse_rss_launch_dates(response["data"])
+            logger.info(
+                f"Successfully extracted launch dates for {len(regions_data)} regions"
+            )
+        except Exception as e:
+            logger.error(f"Failed to parse RSS data: {e}")
+            if cache_entry:
+                logger.warning("Using stale cached RSS results")
+                return cache_entry["regions_data"]
+            return {}
+
+    if cache_file and response["no_store"]:
+        logger.debug("RSS feed sent Cache-Control no-store, not caching")
+    elif cache_file:
+        _save_rss_cache(cache_file, response, regions_data, config.cache_hours * 3600)
+
+    return regions_data
 
 
 def merge_launch_date_sources(
     ssm_launch_date: str, rss_launch_data: Optional[Dict[str, str]]
-) -> Dict[str, str]:
+) -> Mapping[str, str]:
     """Merge launch date information from SSM and RSS sources.
 
     Prioritizes RSS feed data when available and valid, falls back to SSM data.
@@ -255,7 +556,8 @@ def merge_launch_date_sources(
         rss_launch_data: Launch date information from RSS feed (or None)
 
     Returns:
-        Dictionary with merged launch date information:
+        Mapping with merged launch date information (read-only when no source
+        has a date):
         {
             'launch_date': '2006-08-25',
             'source': 'RSS' | 'SSM' | 'Unknown',
@@ -263,32 +565,22 @@ def merge_launch_date_sources(
             'announcement_url': 'https://...' (if from RSS)
         }
     """
-    result = {
-        "launch_date": "Unknown",
-        "source": "Unknown",
-        "formatted_date": "",
-        "announcement_url": "",
-    }
-
     # Prefer RSS data if available and valid
     if rss_launch_data and rss_launch_data.get("launch_date") != "Unknown":
-        result.update(
-            {
-                "launch_date": rss_launch_data["launch_date"],
-                "source": "RSS",
-                "formatted_date": rss_launch_data.get("formatted_date", ""),
-                "announcement_url": rss_launch_data.get("announcement_url", ""),
-            }
-        )
+        return {
+            "launch_date": rss_launch_data["launch_date"],
+            "source": "RSS",
+            "formatted_date": rss_launch_data.get("formatted_date", ""),
+            "announcement_url": rss_launch_data.get("announcement_url", ""),
+        }
+
     # Fall back to SSM data
-    elif ssm_launch_date and ssm_launch_date != "Unknown":
-        result.update(
-            {
-                "launch_date": ssm_launch_date,
-                "source": "SSM",
-                "formatted_date": "",
-                "announcement_url": "",
-            }
-        )
+    if ssm_launch_date and ssm_launch_date != "Unknown":
+        return {
+            "launch_date": ssm_launch_date,
+            "source": "SSM",
+            "formatted_date": "",
+            "announcement_url": "",
+        }
 
-    return result
+    return _UNKNOWN_LAUNCH_DATA
@@ -3,21 +3,46 @@
 Handles AWS credential management, profile configuration, and session creation.
 """
 
+import threading
+from functools import lru_cache
+from typing import Optional
+
 import boto3
 
 from ..core.config import Config
 
+# Serializes cache misses so concurrent callers share one credential resolution
+_SESSION_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _make_session(profile_name: Optional[str]) -> boto3.Session:
+    """Create boto3 session for a profile (cached per profile name).
+
+    Args:
+        profile_name: AWS profile name, or None for the default credential chain
+
+    Returns:
+        Configured boto3 Session instance
+    """
+    if profile_name:
+        return boto3.Session(profile_name=profile_name)
+    else:
+        return boto3.Session()
+
 
 def create_session(config: Config) -> boto3.Session:
     """Create boto3 session with profile configuration.
 
+    Sessions are cached per profile, so repeated calls reuse the same resolved
+    credentials. Callers should still create their own clients from the shared
+    session rather than sharing clients across threads.
+
     Args:
         config: Configuration object containing AWS profile information
 
     Returns:
         Configured boto3 Session instance
     """
-    if config.aws_profile:
-        return boto3.Session(profile_name=config.aws_profile)
-    else:
-        return boto3.Session()
+    with _SESSION_LOCK:
+        return _make_session(config.aws_profile)
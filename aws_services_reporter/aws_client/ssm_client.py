@@ -2,19 +2,82 @@
 
 Handles all interactions with AWS Systems Manager Parameter Store to fetch
 region and service availability information with retry logic and error handling.
+Throttling and transient errors are retried by botocore's adaptive retry mode,
+configured once per client (see _build_client_config).
 """
 
 import logging
-import random
-import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import boto3
+from botocore.config import Config as BotocoreConfig
 from botocore.exceptions import ClientError
 
 from ..core.config import Config
-from .rss_client import get_rss_region_launch_dates, merge_launch_date_sources
+from .rss_client import (
+    close_rss_session,
+    get_rss_region_launch_dates,
+    merge_launch_date_sources,
+)
+
+logger = logging.getLogger(__name__)
+
+# GetParametersByPath accepts MaxResults in the range 1-10; larger values are
+# rejected with a ValidationException, so 10 is already the largest page size
+SSM_PATH_PAGE_SIZE = 10
+
+# Services listed in more regions than this are logged as tail-latency drivers
+HIGH_FANOUT_REGION_COUNT = 30
+
+# GetParameters accepts at most 10 names per request
+SSM_GET_PARAMETERS_BATCH_SIZE = 10
+
+# Region detail parameter names mapped to the result fields they populate
+REGION_DETAIL_KEYS = {
+    "longName": "name",
+    "launchDate": "launch_date",
+    "partition": "partition",
+}
+
+
+def _page_count(item_count: int) -> int:
+    """Number of GetParametersByPath pages needed to list item_count parameters."""
+    return max(1, -(-item_count // SSM_PATH_PAGE_SIZE))
+
+
+def _build_client_config(config: Config) -> BotocoreConfig:
+    """Build botocore client configuration with retry and pool settings.
+
+    Args:
+        config: Configuration object with retry and concurrency settings
+
+    Returns:
+        Botocore Config using adaptive retry mode (standard backoff with jitter
+        plus a client-side token bucket that slows sending once throttling is
+        observed) and an HTTP connection pool large enough that max_workers
+        threads never wait on a free connection
+    """
+    return BotocoreConfig(
+        retries={"total_max_attempts": config.max_retries, "mode": "adaptive"},
+        max_pool_connections=max(config.max_workers, 10),
+    )
+
+
+def _create_ssm_client(session: boto3.Session, config: Config) -> Any:
+    """Create SSM client with the reporter's botocore configuration.
+
+    Args:
+        session: Boto3 session to create the client from
+        config: Configuration object with AWS and retry settings
+
+    Returns:
+        Boto3 SSM client instance
+    """
+    return session.client(
+        "ssm", region_name=config.aws_region, config=_build_client_config(config)
+    )
 
 
 def get_all_parameters_by_path(
@@ -22,77 +85,114 @@ def get_all_parameters_by_path(
 ) -> List[Dict[str, Any]]:
     """Fetch all parameters recursively from SSM Parameter Store path.
 
-    Uses pagination and exponential backoff retry logic to handle rate limiting
-    and transient failures when fetching large parameter sets.
+    Uses the botocore paginator to fetch large parameter sets. Rate limiting and
+    transient failures are retried by the client's botocore retry configuration.
 
     Args:
         ssm: Boto3 SSM client instance
         path: Parameter Store path to fetch (e.g., '/aws/service/global-infrastructure')
-        max_retries: Maximum retry attempts for failed API calls
+        max_retries: Accepted for backward compatibility and ignored; retries
+            are governed by the client's botocore retry configuration
 
     Returns:
         List of parameter dictionaries containing Name, Value, and metadata
 
     Raises:
-        ClientError: If non-retryable AWS API error occurs
-        Exception: If maximum retries exceeded or other error occurs
+        ClientError: If AWS API error persists after client retries
+        Exception: If other error occurs
     """
-    logger = logging.getLogger(__name__)
+    try:
+        paginator = ssm.get_paginator("get_parameters_by_path")
+        pages = paginator.paginate(
+            Path=path,
+            Recursive=False,
+            PaginationConfig={"PageSize": SSM_PATH_PAGE_SIZE},
+        )
+        return [param for page in pages for param in page["Parameters"]]
 
-    for attempt in range(max_retries):
-        try:
-            params = []
-            next_token = None
-            while True:
-                kwargs = {
-                    "Path": path,
-                    "Recursive": False,
-                    "MaxResults": 10,  # SSM public params API hard limit
-                }
-                if next_token:
-                    kwargs["NextToken"] = next_token
+    except ClientError as e:
+        logger.error(f"AWS API error for path {path}: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error for path {path}: {e}")
+        raise
 
-                resp = ssm.get_parameters_by_path(**kwargs)
-                params.extend(resp["Parameters"])
 
-                next_token = resp.get("NextToken")
-                if not next_token:
-                    break
+def get_region_attributes(ssm: Any, names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Get region name, launch date, and partition values with one GetParameters call.
 
-            return params
+    Args:
+        ssm: Boto3 SSM client instance
+        names: Up to SSM_GET_PARAMETERS_BATCH_SIZE full parameter names of the form
+            /aws/service/global-infrastructure/regions/<code>/<key>, where key is
+            one of longName, launchDate, or partition
 
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "Throttling" and attempt < max_retries - 1:
-                wait_time = (2**attempt) + random.uniform(0, 1)
-                logger.warning(
-                    f"Rate limited for path {path}, waiting {wait_time:.2f}s (attempt {attempt + 1})"
-                )
-                time.sleep(wait_time)
-                continue
-            else:
-                logger.error(f"AWS API error for path {path}: {e}")
-                raise
-        except Exception as e:
-            logger.error(f"Unexpected error for path {path}: {e}")
-            if attempt == max_retries - 1:
-                raise
-            time.sleep(2**attempt)
-
-    raise Exception(
-        f"Failed to fetch parameters for {path} after {max_retries} attempts"
-    )
+    Returns:
+        Dictionary mapping region codes to the detail fields that were found
+        Example: {'us-east-1': {'name': 'US East (N. Virginia)', 'partition': 'aws'}}
+        Fields that cannot be retrieved are omitted
+    """
+    attributes: Dict[str, Dict[str, Any]] = {}
+
+    try:
+        response = ssm.get_parameters(Names=names)
+        for param in response["Parameters"]:
+            region_code, key = param["Name"].rsplit("/", 2)[-2:]
+            if key in REGION_DETAIL_KEYS:
+                field = REGION_DETAIL_KEYS[key]
+                attributes.setdefault(region_code, {})[field] = param["Value"]
+        if response.get("InvalidParameters"):
+            logger.debug(
+                f"Region parameters not found: {response['InvalidParameters']}"
+            )
+    except ClientError as e:
+        logger.warning(f"Failed to get region details for {names}: {e}")
+    except Exception as e:
+        logger.warning(f"Unexpected error getting region details for {names}: {e}")
+
+    return attributes
+
+
+def get_az_count(ssm: Any, region_code: str) -> int:
+    """Count the availability zones listed for a region.
+
+    Args:
+        ssm: Boto3 SSM client instance
+        region_code: AWS region code (e.g., 'us-east-1')
+
+    Returns:
+        Number of availability zones, 0 if they cannot be listed
+    """
+    try:
+        az_params = get_all_parameters_by_path(
+            ssm,
+            f"/aws/service/global-infrastructure/regions/{region_code}/availability-zones",
+        )
+        return len(az_params)
+    except Exception as e:
+        logger.debug(f"Failed to get AZ count for region {region_code}: {e}")
+        return 0
+
+
+def _region_detail_names(region_codes: List[str]) -> List[str]:
+    """Build the detail parameter names for each region, in region order."""
+    return [
+        f"/aws/service/global-infrastructure/regions/{code}/{key}"
+        for code in region_codes
+        for key in REGION_DETAIL_KEYS
+    ]
 
 
 def get_region_details(
     ssm: Any, region_code: str, max_retries: int = 3
 ) -> Dict[str, Any]:
-    """Get comprehensive region information with error handling and retries.
+    """Get comprehensive region information with error handling.
 
     Args:
         ssm: Boto3 SSM client instance
         region_code: AWS region code (e.g., 'us-east-1')
-        max_retries: Maximum retry attempts for failed API calls
+        max_retries: Accepted for backward compatibility and ignored; retries
+            are governed by the client's botocore retry configuration
 
     Returns:
         Dictionary with region details:
@@ -105,8 +205,6 @@ def get_region_details(
         }
         Falls back to minimal data if information cannot be retrieved
     """
-    logger = logging.getLogger(__name__)
-
     result = {
         "code": region_code,
         "name": region_code,  # Fallback to code
@@ -115,89 +213,10 @@ def get_region_details(
         "az_count": 0,
     }
 
-    # Get region name
-    for attempt in range(max_retries):
-        try:
-            response = ssm.get_parameter(
-                Name=f"/aws/service/global-infrastructure/regions/{region_code}/longName"
-            )
-            result["name"] = response["Parameter"]["Value"]
-            break
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "Throttling" and attempt < max_retries - 1:
-                wait_time = (2**attempt) + random.uniform(0, 1)
-                logger.warning(
-                    f"Rate limited for region {region_code} name, waiting {wait_time:.2f}s"
-                )
-                time.sleep(wait_time)
-                continue
-            else:
-                logger.warning(f"Failed to get name for region {region_code}: {e}")
-                break
-        except Exception as e:
-            logger.warning(f"Unexpected error for region {region_code} name: {e}")
-            if attempt == max_retries - 1:
-                break
-            time.sleep(2**attempt)
-
-    # Get region launch date
-    for attempt in range(max_retries):
-        try:
-            response = ssm.get_parameter(
-                Name=f"/aws/service/global-infrastructure/regions/{region_code}/launchDate"
-            )
-            result["launch_date"] = response["Parameter"]["Value"]
-            break
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "Throttling" and attempt < max_retries - 1:
-                wait_time = (2**attempt) + random.uniform(0, 1)
-                time.sleep(wait_time)
-                continue
-            else:
-                logger.debug(f"Failed to get launch date for region {region_code}: {e}")
-                break
-        except Exception as e:
-            logger.debug(f"Unexpected error for region {region_code} launch date: {e}")
-            if attempt == max_retries - 1:
-                break
-            time.sleep(2**attempt)
-
-    # Get region partition
-    for attempt in range(max_retries):
-        try:
-            response = ssm.get_parameter(
-                Name=f"/aws/service/global-infrastructure/regions/{region_code}/partition"
-            )
-            result["partition"] = response["Parameter"]["Value"]
-            break
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "Throttling" and attempt < max_retries - 1:
-                wait_time = (2**attempt) + random.uniform(0, 1)
-                time.sleep(wait_time)
-                continue
-            else:
-                logger.debug(f"Failed to get partition for region {region_code}: {e}")
-                break
-        except Exception as e:
-            logger.debug(f"Unexpected error for region {region_code} partition: {e}")
-            if attempt == max_retries - 1:
-                break
-            time.sleep(2**attempt)
-
-    # Get availability zones count
-    try:
-        az_params = get_all_parameters_by_path(
-            ssm,
-            f"/aws/service/global-infrastructure/regions/{region_code}/availability-zones",
-            max_retries,
-        )
-        result["az_count"] = len(az_params)
-    except Exception as e:
-        logger.debug(f"Failed to get AZ count for region {region_code}: {e}")
-        result["az_count"] = 0
+    # Get region name, launch date, and partition in a single batched call
+    attributes = get_region_attributes(ssm, _region_detail_names([region_code]))
+    result.update(attributes.get(region_code, {}))
+    result["az_count"] = get_az_count(ssm, region_code)
 
     return result
 
@@ -232,24 +251,24 @@ def get_all_regions_and_names(
     Raises:
         Exception: If region fetching fails completely
     """
-    logger = logging.getLogger(__name__)
     if not quiet:
         print("🔍 Fetching AWS regions...")
 
-    ssm = session.client("ssm", region_name=config.aws_region)
+    ssm = _create_ssm_client(session, config)
 
-    # Fetch RSS launch date data first
+    # Fetch RSS launch date data in the background so the network round trip
+    # overlaps with the SSM region enumeration below
     if not quiet:
         print("  ⏳ Fetching launch dates from RSS feed...")
-    rss_launch_data = get_rss_region_launch_dates(config)
-    if not quiet:
-        print(f"  ✓ Retrieved launch dates for {len(rss_launch_data)} regions from RSS")
+    rss_executor = ThreadPoolExecutor(max_workers=1)
+    rss_future = rss_executor.submit(get_rss_region_launch_dates, config)
+    rss_executor.shutdown(wait=False)
 
     # Get all region codes
     if not quiet:
         print("  ⏳ Getting region codes from SSM...")
     region_params = get_all_parameters_by_path(
-        ssm, "/aws/service/global-infrastructure/regions", config.max_retries
+        ssm, "/aws/service/global-infrastructure/regions"
     )
 
     if not quiet:
@@ -260,25 +279,54 @@ def get_all_regions_and_names(
 
     regions = {}
 
-    # Create separate SSM clients for each thread to avoid session conflicts
+    # Request name, launch date, and partition for all regions in batches of
+    # up to 10 parameters rather than one GetParameters call per region
+    region_codes = [region["Value"] for region in region_params]
+    detail_names = _region_detail_names(region_codes)
+    batches = [
+        detail_names[i : i + SSM_GET_PARAMETERS_BATCH_SIZE]
+        for i in range(0, len(detail_names), SSM_GET_PARAMETERS_BATCH_SIZE)
+    ]
+
     with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-        # Submit all region detail fetching tasks
-        future_to_region = {}
-        for region in region_params:
-            region_code = region["Value"]
-            # Create a new SSM client for each thread
-            thread_ssm = session.client("ssm", region_name=config.aws_region)
-            future = executor.submit(
-                get_region_details, thread_ssm, region_code, config.max_retries
+        # Submit detail batches and per-region AZ counts
+        attribute_futures = [
+            executor.submit(get_region_attributes, ssm, batch) for batch in batches
+        ]
+        future_to_region = {
+            executor.submit(get_az_count, ssm, code): code for code in region_codes
+        }
+
+        # RSS data is needed to merge launch dates; region details keep
+        # fetching in the pool while we wait for it
+        try:
+            rss_launch_data = rss_future.result()
+        finally:
+            # The feed is fetched once per run, so release its pooled
+            # connections as soon as it is done
+            close_rss_session()
+        if not quiet:
+            print(
+                f"  ✓ Retrieved launch dates for {len(rss_launch_data)} regions from RSS"
             )
-            future_to_region[future] = region_code
+
+        attributes: Dict[str, Dict[str, Any]] = {}
+        for future in attribute_futures:
+            for code, fields in future.result().items():
+                attributes.setdefault(code, {}).update(fields)
 
         # Collect results as they complete
         completed_count = 0
         for future in as_completed(future_to_region):
             completed_count += 1
-            details = future.result()
-            code = details["code"]
+            code = future_to_region[future]
+            details = {
+                "name": code,  # Fallback to code
+                "launch_date": "Unknown",
+                "partition": "Unknown",
+                **attributes.get(code, {}),
+                "az_count": future.result(),
+            }
 
             # Merge launch date information from RSS and SSM sources
             rss_data = rss_launch_data.get(code)
@@ -309,8 +357,107 @@ def get_all_regions_and_names(
     return regions
 
 
+def _get_services_by_region(
+    config: Config,
+    session: boto3.Session,
+    quiet: bool = False,
+    region_codes: Optional[Iterable[str]] = None,
+) -> Dict[str, List[str]]:
+    """Build the region to services mapping from per-region service listings.
+
+    There are far fewer regions than services, so listing each region's
+    services takes roughly a tenth of the GetParametersByPath calls needed to
+    list each service's regions.
+
+    Args:
+        config: Configuration object with AWS settings and concurrency limits
+        session: Boto3 session for API calls
+        quiet: Suppress progress output if True
+        region_codes: Region codes already fetched by the caller; listed from
+            SSM when not provided
+
+    Returns:
+        Dictionary mapping region codes to lists of available services, each
+        list deduplicated and sorted by service code
+    """
+    ssm = _create_ssm_client(session, config)
+
+    if region_codes is None:
+        if not quiet:
+            print("  ⏳ Getting region codes from SSM...")
+        region_codes = [
+            region["Value"]
+            for region in get_all_parameters_by_path(
+                ssm, "/aws/service/global-infrastructure/regions"
+            )
+        ]
+        if not quiet:
+            print(f"  ✓ Found {len(region_codes)} regions")
+    else:
+        region_codes = list(region_codes)
+
+    if not quiet:
+        print(
+            f"  ⏳ Listing services per region (using {config.max_workers} concurrent workers)..."
+        )
+
+    fetched = {}
+
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        # Submit all region service listing tasks
+        future_to_region = {}
+        for region_code in region_codes:
+            future = executor.submit(
+                get_all_parameters_by_path,
+                ssm,
+                f"/aws/service/global-infrastructure/regions/{region_code}/services",
+            )
+            future_to_region[future] = region_code
+
+        # Collect results as they complete
+        completed_count = 0
+        for future in as_completed(future_to_region):
+            completed_count += 1
+            region_code = future_to_region[future]
+            try:
+                services = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to get services for region {region_code}: {e}")
+                if not quiet:
+                    print(
+                        f"    🔧 {completed_count:3d}/{len(region_codes)}: "
+                        f"{region_code:15s} (error - skipping)"
+                    )
+                continue
+
+            fetched[region_code] = sorted({s["Value"] for s in services})
+            logger.debug(
+                f"Region {region_code} lists {len(services)} services "
+                f"({_page_count(len(services))} pages)"
+            )
+            if not quiet:
+                print(
+                    f"    🔧 {completed_count:3d}/{len(region_codes)}: "
+                    f"{region_code:15s} ({len(services)} services)"
+                )
+
+    # Keep region listing order so results are deterministic
+    region_services = {
+        region_code: fetched[region_code]
+        for region_code in region_codes
+        if fetched.get(region_code)
+    }
+
+    logger.info(f"Mapped services across {len(region_services)} regions")
+    return region_services
+
+
 def get_services_per_region(
-    config: Config, session: boto3.Session, quiet: bool = False
+    config: Config,
+    session: boto3.Session,
+    quiet: bool = False,
+    service_params: Optional[List[Dict[str, Any]]] = None,
+    region_codes: Optional[Iterable[str]] = None,
 ) -> Dict[str, List[str]]:
     """Fetch AWS services available in each region using concurrent processing.
 
@@ -318,110 +465,170 @@ def get_services_per_region(
         config: Configuration object with AWS settings and concurrency limits
         session: Boto3 session for API calls
         quiet: Suppress progress output if True
+        service_params: Service code parameters already listed from SSM;
+            fetched here when not provided (only used when
+            config.services_by_region is False)
+        region_codes: Region codes already fetched (e.g. the keys returned by
+            get_all_regions_and_names); listed from SSM when not provided
+            (only used when config.services_by_region is True)
 
     Returns:
-        Dictionary mapping region codes to lists of available services
-        Example: {'us-east-1': ['ec2', 's3', 'lambda'], 'eu-west-1': ['ec2', 's3']}
+        Dictionary mapping region codes to lists of available services, each
+        list deduplicated and sorted by service code
+        Example: {'us-east-1': ['ec2', 'lambda', 's3'], 'eu-west-1': ['ec2', 's3']}
 
     Raises:
         Exception: If service fetching fails completely
     """
-    logger = logging.getLogger(__name__)
     if not quiet:
         print("\n🔧 Fetching AWS services availability...")
 
-    ssm = session.client("ssm", region_name=config.aws_region)
+    if config.services_by_region:
+        return _get_services_by_region(config, session, quiet, region_codes)
 
-    # Get all services
-    if not quiet:
-        print("  ⏳ Getting service codes from SSM...")
-    service_params = get_all_parameters_by_path(
-        ssm, "/aws/service/global-infrastructure/services", config.max_retries
-    )
+    # One client is shared by all worker threads; botocore clients are
+    # thread-safe once built, so its connection pool is reused by every task
+    ssm = _create_ssm_client(session, config)
+
+    if service_params is None:
+        # Get all services
+        if not quiet:
+            print("  ⏳ Getting service codes from SSM...")
+        service_params = get_all_parameters_by_path(
+            ssm, "/aws/service/global-infrastructure/services"
+        )
+
+    # Work in service code order so progress and results are deterministic
+    service_params = sorted(service_params, key=lambda p: p["Value"])
 
     if not quiet:
         print(f"  ✓ Found {len(service_params)} services")
-        print("  ⏳ Mapping services to regions...")
-
-    region_services = {}
+        print(
+            f"  ⏳ Mapping services to regions (using {config.max_workers} concurrent workers)..."
+        )
 
-    for i, service in enumerate(service_params, 1):
-        service_code = service["Value"]
+    # (region, service) availability edges, inverted once all fetches finish
+    edges: List[Tuple[str, str]] = []
+    region_counts: Dict[str, int] = {}
 
-        if not quiet:
-            print(
-                f"    🔧 {i:3d}/{len(service_params)}: {service_code:15s}",
-                end="",
-                flush=True,
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        # Submit all service region fetching tasks
+        future_to_service = {}
+        for service in service_params:
+            service_code = service["Value"]
+            future = executor.submit(
+                get_all_parameters_by_path,
+                ssm,
+                f"/aws/service/global-infrastructure/services/{service_code}/regions",
             )
+            future_to_service[future] = service_code
 
-        # Get regions where this service is available
-        service_path = (
-            f"/aws/service/global-infrastructure/services/{service_code}/regions"
-        )
-        try:
-            svc_regions = get_all_parameters_by_path(
-                ssm, service_path, config.max_retries
+        # Collect results as they complete; per-service detail goes to the
+        # debug log rather than one console line per service
+        for future in as_completed(future_to_service):
+            service_code = future_to_service[future]
+            try:
+                svc_regions = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to get regions for service {service_code}: {e}")
+                continue
+
+            edges.extend((r["Value"], service_code) for r in svc_regions)
+            region_counts[service_code] = len(svc_regions)
+            logger.debug(
+                f"Service {service_code} available in {len(svc_regions)} regions "
+                f"({_page_count(len(svc_regions))} pages)"
             )
-        except Exception as e:
-            logger.warning(f"Failed to get regions for service {service_code}: {e}")
-            if not quiet:
-                print(" (error - skipping)")
-            continue
 
-        if not quiet:
-            print(f" (available in {len(svc_regions)} regions)")
+    if not quiet:
+        print(f"  ✓ Mapped {len(region_counts)}/{len(service_params)} services")
+
+    # Services spanning many regions need several sequential listing pages and
+    # drive the tail latency of this phase
+    high_fanout = sorted(
+        code
+        for code, count in region_counts.items()
+        if count > HIGH_FANOUT_REGION_COUNT
+    )
+    if high_fanout:
+        logger.info(
+            f"{len(high_fanout)} services available in more than "
+            f"{HIGH_FANOUT_REGION_COUNT} regions: {', '.join(high_fanout)}"
+        )
 
-        for r in svc_regions:
-            region = r["Value"]
-            region_services.setdefault(region, []).append(service_code)
+    # Invert the edges in one pass; sorting below makes the result independent
+    # of completion order
+    region_services: Dict[str, Set[str]] = defaultdict(set)
+    for region, service_code in edges:
+        region_services[region].add(service_code)
 
     logger.info(f"Mapped {len(service_params)} services across regions")
-    return region_services
+    return {region: sorted(services) for region, services in region_services.items()}
 
 
 def get_service_name(ssm: Any, service_code: str, max_retries: int = 3) -> str:
-    """Get service display name with error handling and retries.
+    """Get service display name with error handling.
 
     Args:
         ssm: Boto3 SSM client instance
         service_code: AWS service code (e.g., 'ec2', 'lambda')
-        max_retries: Maximum retry attempts for failed API calls
+        max_retries: Accepted for backward compatibility and ignored; retries
+            are governed by the client's botocore retry configuration
 
     Returns:
         Service display name, falls back to service code if name cannot be retrieved
     """
-    logger = logging.getLogger(__name__)
+    try:
+        response = ssm.get_parameter(
+            Name=f"/aws/service/global-infrastructure/services/{service_code}/longName"
+        )
+        return response["Parameter"]["Value"]
+    except ClientError as e:
+        logger.debug(f"Failed to get name for service {service_code}: {e}")
+    except Exception as e:
+        logger.debug(f"Unexpected error for service {service_code}: {e}")
 
-    for attempt in range(max_retries):
-        try:
-            response = ssm.get_parameter(
-                Name=f"/aws/service/global-infrastructure/services/{service_code}/longName"
-            )
-            return response["Parameter"]["Value"]
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code == "Throttling" and attempt < max_retries - 1:
-                wait_time = (2**attempt) + random.uniform(0, 1)
-                logger.debug(
-                    f"Rate limited for service {service_code}, waiting {wait_time:.2f}s"
-                )
-                time.sleep(wait_time)
-                continue
-            else:
-                logger.debug(f"Failed to get name for service {service_code}: {e}")
-                return service_code  # Fallback to code
-        except Exception as e:
-            logger.debug(f"Unexpected error for service {service_code}: {e}")
-            if attempt == max_retries - 1:
-                return service_code  # Fallback to code
-            time.sleep(2**attempt)
+    return service_code  # Fallback to code
 
-    return service_code
+
+def get_service_names(ssm: Any, service_codes: List[str]) -> Dict[str, str]:
+    """Get display names for a batch of services with a single GetParameters call.
+
+    Args:
+        ssm: Boto3 SSM client instance
+        service_codes: Up to SSM_GET_PARAMETERS_BATCH_SIZE service codes
+
+    Returns:
+        Dictionary mapping service codes to display names; services whose name
+        cannot be retrieved fall back to their service code
+    """
+    names = {code: code for code in service_codes}
+
+    try:
+        response = ssm.get_parameters(
+            Names=[
+                f"/aws/service/global-infrastructure/services/{code}/longName"
+                for code in service_codes
+            ]
+        )
+        for param in response.get("Parameters", []):
+            # Name is .../services/<code>/longName
+            names[param["Name"].rsplit("/", 2)[-2]] = param["Value"]
+        for name in response.get("InvalidParameters", []):
+            logger.debug(f"No name parameter found: {name}")
+    except ClientError as e:
+        logger.debug(f"Failed to get names for services {service_codes}: {e}")
+    except Exception as e:
+        logger.debug(f"Unexpected error for services {service_codes}: {e}")
+
+    return names
 
 
 def get_all_services_with_names(
-    config: Config, session: boto3.Session, quiet: bool = False
+    config: Config,
+    session: boto3.Session,
+    quiet: bool = False,
+    service_params: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, str]:
     """Fetch all AWS services with their display names using concurrent processing.
 
@@ -429,26 +636,33 @@ def get_all_services_with_names(
         config: Configuration object with AWS settings
         session: Boto3 session for API calls
         quiet: Suppress progress output if True
+        service_params: Service code parameters already listed from SSM;
+            fetched here when not provided
 
     Returns:
-        Dictionary mapping service codes to display names
+        Dictionary mapping service codes to display names, in service code order
         Example: {'ec2': 'Amazon Elastic Compute Cloud', 's3': 'Amazon Simple Storage Service'}
 
     Raises:
         Exception: If service fetching fails completely
     """
-    logger = logging.getLogger(__name__)
     if not quiet:
         print("📋 Fetching AWS service names...")
 
-    ssm = session.client("ssm", region_name=config.aws_region)
+    # One client is shared by all worker threads; botocore clients are
+    # thread-safe once built, so its connection pool is reused by every task
+    ssm = _create_ssm_client(session, config)
 
-    # Get all service codes
-    if not quiet:
-        print("  ⏳ Getting service codes from SSM...")
-    service_params = get_all_parameters_by_path(
-        ssm, "/aws/service/global-infrastructure/services", config.max_retries
-    )
+    if service_params is None:
+        # Get all service codes
+        if not quiet:
+            print("  ⏳ Getting service codes from SSM...")
+        service_params = get_all_parameters_by_path(
+            ssm, "/aws/service/global-infrastructure/services"
+        )
+
+    # Work in service code order so progress and results are deterministic
+    service_params = sorted(service_params, key=lambda p: p["Value"])
 
     if not quiet:
         print(f"  ✓ Found {len(service_params)} services")
@@ -458,33 +672,77 @@ def get_all_services_with_names(
 
     services = {}
 
-    # Create separate SSM clients for each thread to avoid session conflicts
+    service_codes = [service["Value"] for service in service_params]
+    batches = [
+        service_codes[i : i + SSM_GET_PARAMETERS_BATCH_SIZE]
+        for i in range(0, len(service_codes), SSM_GET_PARAMETERS_BATCH_SIZE)
+    ]
+
     with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-        # Submit all service name fetching tasks
-        future_to_service = {}
-        for service in service_params:
-            service_code = service["Value"]
-            # Create a new SSM client for each thread
-            thread_ssm = session.client("ssm", region_name=config.aws_region)
-            future = executor.submit(
-                get_service_name, thread_ssm, service_code, config.max_retries
-            )
-            future_to_service[future] = service_code
+        # Submit one GetParameters call per batch of service codes
+        futures = [executor.submit(get_service_names, ssm, batch) for batch in batches]
 
-        # Collect results as they complete
-        completed_count = 0
-        for future in as_completed(future_to_service):
-            completed_count += 1
-            service_code = future_to_service[future]
-            service_name = future.result()
-            services[service_code] = service_name
-            if not quiet:
-                print(
-                    f"    📋 {completed_count}/{len(service_params)}: {service_code} → {service_name}"
-                )
+        # Collect results as they complete; per-service detail goes to the
+        # debug log rather than one console line per service
+        for future in as_completed(futures):
+            batch_names = future.result()
+            services.update(batch_names)
+            logger.debug(f"Fetched service names: {batch_names}")
+
+    if not quiet:
+        print(f"  ✓ Fetched {len(services)} service names")
 
     logger.info(f"Successfully fetched {len(services)} service names")
-    return services
+    return dict(sorted(services.items()))
+
+
+def build_enhanced_services(
+    region_services: Dict[str, List[str]],
+    service_names: Dict[str, str],
+    quiet: bool = False,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Combine an already-fetched service mapping and service names.
+
+    Builds the enhanced per-region metadata in a single pass without any
+    further API calls, so callers that already hold both inputs do not need
+    to fetch them again through get_services_per_region_enhanced.
+
+    Args:
+        region_services: Dictionary mapping region codes to lists of services
+        service_names: Dictionary mapping service codes to display names
+        quiet: Suppress progress output if True
+
+    Returns:
+        Dictionary mapping region codes to service dictionaries with available
+        metadata (see get_services_per_region_enhanced)
+    """
+    if not quiet:
+        print("  ⏳ Building enhanced service metadata...")
+
+    enhanced_services = {}
+    total_service_entries = 0
+
+    # Create enhanced metadata with only available data
+    for region_code, services in region_services.items():
+        enhanced_services[region_code] = {
+            service_code: {
+                # Only include data we can actually retrieve
+                "name": service_names.get(service_code, service_code),
+                "status": "available",  # If it's in the region, it's available
+            }
+            for service_code in services
+        }
+        total_service_entries += len(services)
+
+    if not quiet:
+        print(
+            f"  ✓ Enhanced service metadata complete: {len(enhanced_services)} regions, {total_service_entries:,} service entries"
+        )
+
+    logger.info(
+        f"Created enhanced service metadata for {len(enhanced_services)} regions ({total_service_entries:,} entries)"
+    )
+    return enhanced_services
 
 
 def get_services_per_region_enhanced(
@@ -516,44 +774,26 @@ def get_services_per_region_enhanced(
     Raises:
         Exception: If service fetching fails completely
     """
-    logger = logging.getLogger(__name__)
     if not quiet:
         print("\n🔧 Creating enhanced service mapping with full names...")
 
+    # List service codes once and share them with both lookups below
+    ssm = _create_ssm_client(session, config)
+    service_params = get_all_parameters_by_path(
+        ssm, "/aws/service/global-infrastructure/services"
+    )
+
     # Get basic region services mapping
-    region_services = get_services_per_region(config, session, quiet)
+    region_services = get_services_per_region(
+        config, session, quiet, service_params=service_params
+    )
 
     # Get service names (this is the only enhanced metadata actually available)
-    service_names = get_all_services_with_names(config, session, quiet)
-
-    if not quiet:
-        print("  ⏳ Building enhanced service metadata...")
-
-    enhanced_services = {}
-
-    # Create enhanced metadata with only available data
-    for region_code, services in region_services.items():
-        enhanced_services[region_code] = {}
-        for service_code in services:
-            enhanced_services[region_code][service_code] = {
-                # Only include data we can actually retrieve
-                "name": service_names.get(service_code, service_code),
-                "status": "available",  # If it's in the region, it's available
-            }
-
-    total_service_entries = sum(
-        len(services) for services in enhanced_services.values()
+    service_names = get_all_services_with_names(
+        config, session, quiet, service_params=service_params
     )
 
-    if not quiet:
-        print(
-            f"  ✓ Enhanced service metadata complete: {len(enhanced_services)} regions, {total_service_entries:,} service entries"
-        )
-
-    logger.info(
-        f"Created enhanced service metadata for {len(enhanced_services)} regions ({total_service_entries:,} entries)"
-    )
-    return enhanced_services
+    return build_enhanced_services(region_services, service_names, quiet)
 
 
 def get_all_services() -> List[str]:
@@ -565,7 +805,9 @@ def get_all_services() -> List[str]:
     Raises:
         Exception: If service fetching fails
     """
-    ssm = boto3.client("ssm", region_name="us-east-1")
+    ssm = boto3.client(
+        "ssm", region_name="us-east-1", config=_build_client_config(Config())
+    )
     service_params = get_all_parameters_by_path(
         ssm, "/aws/service/global-infrastructure/services"
     )
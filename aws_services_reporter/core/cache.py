@@ -4,11 +4,43 @@ Provides persistent caching of AWS service data with time-to-live (TTL) validati
 corruption detection, and automatic cleanup. Reduces API calls by 99% for repeated runs.
 """
 
+import gzip
 import json
 import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Use orjson for faster cache serialization when it is installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize cache data to compact UTF-8 JSON bytes, using orjson when available.
+
+    The cache is only ever read by this module, so no indentation is emitted.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse cache JSON bytes, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+    corruption the same way with either parser.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class AWSDataCache:
@@ -18,84 +50,105 @@ class AWSDataCache:
     corruption detection, and automatic cleanup. Reduces API calls by 99% for repeated runs.
 
     Attributes:
-        cache_file: Path to the cache file
+        cache_file: Path to the cache file (gzip-compressed when it ends in .gz)
         cache_duration: Time-to-live for cached data
         logger: Logger instance for cache operations
     """
 
     def __init__(
-        self, cache_file: str = "aws_data_cache.json", cache_hours: int = 24
+        self, cache_file: str = "aws_data_cache.json.gz", cache_hours: int = 24
     ) -> None:
         """Initialize the cache system.
 
         Args:
-            cache_file: Path to cache file (default: aws_data_cache.json)
+            cache_file: Path to cache file (default: aws_data_cache.json.gz);
+                a .gz suffix stores the JSON gzip-compressed
             cache_hours: Cache validity period in hours (default: 24)
         """
         self.cache_file = Path(cache_file)
+        self.compressed = self.cache_file.suffix == ".gz"
         self.cache_duration = timedelta(hours=cache_hours)
         self.logger = logging.getLogger(__name__)
 
-    def is_valid(self) -> bool:
-        """Check if cache exists and is still valid.
+    def _read_and_validate(self) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Read the cache file once and check it against the TTL.
 
         Returns:
-            True if cache file exists, is readable, and within TTL period
+            Tuple of (parsed cache data or None if unreadable, validity flag)
 
         Raises:
             None - All exceptions are caught and logged
         """
         if not self.cache_file.exists():
             self.logger.debug("Cache file does not exist")
-            return False
+            return None, False
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            opener = gzip.open if self.compressed else open
+            with opener(self.cache_file, "rb") as f:
+                cache_data = _loads(f.read())
 
             if "timestamp" not in cache_data:
                 self.logger.warning("Cache file missing timestamp")
-                return False
+                return cache_data, False
 
             cached_time = datetime.fromisoformat(cache_data["timestamp"])
             age = datetime.now() - cached_time
             is_valid = age < self.cache_duration
 
             self.logger.info(f"Cache age: {age}, Valid: {is_valid}")
-            return is_valid
+            return cache_data, is_valid
 
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (json.JSONDecodeError, ValueError, KeyError, OSError, EOFError) as e:
             self.logger.warning(f"Cache file corrupted: {e}")
-            return False
+            return None, False
         except Exception as e:
             self.logger.error(f"Error checking cache validity: {e}")
-            return False
+            return None, False
+
+    def is_valid(self) -> bool:
+        """Check if cache exists and is still valid.
+
+        Returns:
+            True if cache file exists, is readable, and within TTL period
+
+        Raises:
+            None - All exceptions are caught and logged
+        """
+        _, is_valid = self._read_and_validate()
+        return is_valid
 
     def load(self) -> Optional[Dict[str, Any]]:
         """Load cached data if valid.
 
+        The cache file is read and parsed once for both the TTL check and the
+        returned data.
+
         Returns:
-            Dictionary containing regions, region_services, and metadata
+            Dictionary containing regions, region_services, service_names,
+            enhanced_services, and metadata
             None if cache is invalid or cannot be loaded
 
         Example:
             {
                 'regions': {'us-east-1': 'US East (N. Virginia)'},
                 'region_services': {'us-east-1': ['ec2', 's3']},
+                'service_names': {'ec2': 'Amazon EC2'},
+                'enhanced_services': {},
                 'metadata': {'fetch_duration': 45.2}
             }
         """
-        if not self.is_valid():
+        cache_data, is_valid = self._read_and_validate()
+        if not is_valid:
             return None
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-
             self.logger.info(f"Loaded cache from {self.cache_file}")
             return {
                 "regions": cache_data.get("regions", {}),
                 "region_services": cache_data.get("region_services", {}),
+                "service_names": cache_data.get("service_names", {}),
+                "enhanced_services": cache_data.get("enhanced_services", {}),
                 "metadata": cache_data.get("metadata", {}),
             }
 
@@ -124,7 +177,8 @@ class AWSDataCache:
             True if cache was successfully saved, False otherwise
 
         Note:
-            Automatically adds timestamp, version info, and statistics
+            Automatically adds timestamp, version info, and statistics; the
+            file is serialized and written once
         """
         try:
             cache_data = {
@@ -138,28 +192,31 @@ class AWSDataCache:
                     "version": "1.4.1",
                     "total_regions": len(regions),
                     "total_services": len(
-                        set().union(*region_services.values())
-                        if region_services
-                        else []
+                        {
+                            service
+                            for services in region_services.values()
+                            for service in services
+                        }
                     ),
-                    "cache_file_size": 0,  # Will be updated after save
                 },
             }
 
             # Ensure cache directory exists
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write cache file
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            # Write cache file (get_stats reports the on-disk size)
+            # Write to a temporary file and swap it into place so an
+            # interrupted save never leaves a truncated cache behind
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            opener = gzip.open if self.compressed else open
+            try:
+                with opener(tmp_file, "wb") as f:
+                    f.write(_dumps(cache_data))
+                os.replace(tmp_file, self.cache_file)
+            finally:
+                tmp_file.unlink(missing_ok=True)
 
-            # Update file size in cache info
             file_size = self.cache_file.stat().st_size
-            cache_data["cache_info"]["cache_file_size"] = file_size
-
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
-
             self.logger.info(f"Saved cache to {self.cache_file} ({file_size:,} bytes)")
             return True
 
@@ -205,15 +262,16 @@ class AWSDataCache:
             return {"exists": False}
 
         try:
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            cache_data, is_valid = self._read_and_validate()
+            if cache_data is None:
+                raise ValueError("Cache file could not be read")
 
             cached_time = datetime.fromisoformat(cache_data["timestamp"])
             age = datetime.now() - cached_time
 
             return {
                 "exists": True,
-                "valid": self.is_valid(),
+                "valid": is_valid,
                 "age_hours": age.total_seconds() / 3600,
                 "file_size": self.cache_file.stat().st_size,
                 "cache_info": cache_data.get("cache_info", {}),
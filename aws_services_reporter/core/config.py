@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Configuration settings for the AWS Services Reporter.
 
@@ -29,6 +29,8 @@ class Config:
         use_rich: Use Rich library for enhanced output
         output_formats: List of output formats to generate
         enhanced_metadata: Enable enhanced metadata fetching
+        services_by_region: Build the service mapping from per-region service
+            listings (False lists each service's regions instead)
         include_services: List of service patterns to include (wildcards supported)
         exclude_services: List of service patterns to exclude (wildcards supported)
         include_regions: List of region patterns to include (wildcards supported)
@@ -46,10 +48,11 @@ class Config:
     max_retries: int = 3
     cache_enabled: bool = True
     cache_hours: int = 24
-    cache_file: str = "cache/aws_data_cache.json"
+    cache_file: str = "cache/aws_data_cache.json.gz"
     use_rich: bool = True
     output_formats: Optional[List[str]] = None
     enhanced_metadata: bool = True
+    services_by_region: bool = True
     include_services: Optional[List[str]] = None
     exclude_services: Optional[List[str]] = None
     include_regions: Optional[List[str]] = None
@@ -81,6 +84,7 @@ def create_config_from_args(args: argparse.Namespace) -> Config:
         use_rich=not getattr(args, "quiet", False),
         output_formats=args.format,
         enhanced_metadata=not getattr(args, "no_enhanced_metadata", False),
+        services_by_region=not getattr(args, "map_by_service", False),
         include_services=getattr(args, "include_services", None),
         exclude_services=getattr(args, "exclude_services", None),
         include_regions=getattr(args, "include_regions", None),
@@ -4,28 +4,54 @@ Provides beautiful progress bars, spinners, and status messages using the Rich l
 with graceful fallback to simple text output when Rich is not available.
 """
 
+import io
+from types import SimpleNamespace
 from typing import Any, List, Optional, Tuple
 
-from tabulate import tabulate
+# Whether Rich can be imported: None until the first tracker asks for it
+RICH_AVAILABLE = None
+_rich = None
 
-# Try to import Rich for enhanced progress tracking
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.progress import (
-        BarColumn,
-        Progress,
-        SpinnerColumn,
-        TextColumn,
-        TimeElapsedColumn,
-        TimeRemainingColumn,
-    )
-    from rich.table import Table
 
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    Console = None
+def _load_rich() -> Optional[SimpleNamespace]:
+    """Import Rich on first use so quiet and plain-text runs never load it.
+
+    Returns:
+        Namespace of the Rich classes used by ProgressTracker, or None when
+        Rich is not installed
+    """
+    global RICH_AVAILABLE, _rich
+
+    if RICH_AVAILABLE is None:
+        try:
+            from rich.console import Console
+            from rich.panel import Panel
+            from rich.progress import (
+                BarColumn,
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+                TimeElapsedColumn,
+                TimeRemainingColumn,
+            )
+            from rich.table import Table
+
+            _rich = SimpleNamespace(
+                Console=Console,
+                Panel=Panel,
+                BarColumn=BarColumn,
+                Progress=Progress,
+                SpinnerColumn=SpinnerColumn,
+                TextColumn=TextColumn,
+                TimeElapsedColumn=TimeElapsedColumn,
+                TimeRemainingColumn=TimeRemainingColumn,
+                Table=Table,
+            )
+            RICH_AVAILABLE = True
+        except ImportError:
+            RICH_AVAILABLE = False
+
+    return _rich
 
 
 class ProgressTracker:
@@ -48,10 +74,14 @@ class ProgressTracker:
             use_rich: Enable Rich library features if available
             quiet: Suppress all progress output
         """
-        self.use_rich = use_rich and RICH_AVAILABLE and not quiet
+        self._rich = _load_rich() if use_rich and not quiet else None
+        self.use_rich = self._rich is not None
         self.quiet = quiet
-        self.console = Console() if self.use_rich else None
+        self.console = self._rich.Console() if self.use_rich else None
         self.current_progress = None
+        self._pending_advance = 0
+        self._update_batch_size = 1
+        self._remaining: Optional[int] = None
 
     def start_operation(
         self, description: str, total: Optional[int] = None
@@ -71,23 +101,29 @@ class ProgressTracker:
 
         if self.use_rich:
             # Create rich progress bar
-            progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn() if total else TextColumn(""),
+            rich = self._rich
+            progress = rich.Progress(
+                rich.SpinnerColumn(),
+                rich.TextColumn("[progress.description]{task.description}"),
+                rich.BarColumn() if total else rich.TextColumn(""),
                 (
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%")
+                    rich.TextColumn("[progress.percentage]{task.percentage:>3.0f}%")
                     if total
-                    else TextColumn("")
+                    else rich.TextColumn("")
                 ),
-                TimeElapsedColumn(),
-                TimeRemainingColumn() if total else TextColumn(""),
+                rich.TimeElapsedColumn(),
+                rich.TimeRemainingColumn() if total else rich.TextColumn(""),
                 console=self.console,
                 transient=False,
             )
             progress.start()
             task_id = progress.add_task(description, total=total or 100)
             self.current_progress = (progress, task_id)
+
+            # Redraw roughly 200 times over the operation instead of per item
+            self._pending_advance = 0
+            self._update_batch_size = max(1, total // 200) if total else 50
+            self._remaining = total or None
             return self.current_progress
         else:
             # Fallback to simple print
@@ -99,6 +135,10 @@ class ProgressTracker:
     ) -> None:
         """Update progress bar with advancement and optional description.
 
+        Advancement is accumulated and applied in batches so per-item callers
+        do not force a redraw on every call; a new description, or reaching
+        the operation's total, is applied immediately.
+
         Args:
             advance: Number of units to advance (default: 1)
             description: Updated description for the progress bar
@@ -107,8 +147,28 @@ class ProgressTracker:
             return
 
         if self.use_rich and self.current_progress:
-            progress, task_id = self.current_progress
-            progress.update(task_id, advance=advance, description=description)
+            self._pending_advance += advance
+            if (
+                self._pending_advance >= self._update_batch_size
+                or description
+                or (
+                    self._remaining is not None
+                    and self._pending_advance >= self._remaining
+                )
+            ):
+                self._flush_progress(description)
+
+    def _flush_progress(self, description: Optional[str] = None) -> None:
+        """Apply accumulated progress advancement to the Rich progress bar.
+
+        Args:
+            description: Updated description for the progress bar
+        """
+        progress, task_id = self.current_progress
+        progress.update(task_id, advance=self._pending_advance, description=description)
+        if self._remaining is not None:
+            self._remaining -= self._pending_advance
+        self._pending_advance = 0
 
     def finish_operation(self, success_message: Optional[str] = None) -> None:
         """Finish current operation and display success message.
@@ -120,6 +180,8 @@ class ProgressTracker:
             return
 
         if self.use_rich and self.current_progress:
+            if self._pending_advance:
+                self._flush_progress()
             progress, task_id = self.current_progress
             progress.stop()
             self.current_progress = None
@@ -161,13 +223,33 @@ class ProgressTracker:
             return
 
         if self.use_rich:
-            table = Table(title=title)
+            table = self._rich.Table(title=title)
             for header in headers:
                 table.add_column(header)
             for row in data:
                 table.add_row(*[str(cell) for cell in row])
-            self.console.print(table)
+
+            if self.current_progress is not None:
+                # A live progress display owns the terminal; let the console
+                # redraw it around the table
+                self.console.print(table)
+                return
+
+            # Render the whole table off-screen, then emit it in one write
+            buffer_console = self._rich.Console(
+                file=io.StringIO(),
+                force_terminal=self.console.is_terminal,
+                color_system=self.console.color_system,
+                width=self.console.width,
+            )
+            buffer_console.print(table)
+            self.console.file.write(buffer_console.file.getvalue())
+            self.console.file.flush()
         else:
+            # Only the plain-text fallback needs tabulate, so import it here
+            # rather than on every import of this module
+            from tabulate import tabulate
+
             if title:
                 print(f"\n{title}")
             print(tabulate(data, headers=headers, tablefmt="grid"))
@@ -183,7 +265,7 @@ class ProgressTracker:
             return
 
         if self.use_rich:
-            panel = Panel(content, title=title)
+            panel = self._rich.Panel(content, title=title)
             self.console.print(panel)
         else:
             if title:
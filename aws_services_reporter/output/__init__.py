@@ -3,13 +3,23 @@
 Provides CSV, JSON, and Excel output generation with statistics and metadata.
 """
 
-from .csv_output import create_regions_services_csv, create_services_regions_matrix_csv
+from .csv_output import (
+    create_region_summary_csv,
+    create_regions_services_csv,
+    create_service_summary_csv,
+    create_services_regions_matrix_csv,
+)
 from .excel_output import create_excel_output
 from .json_output import create_json_output
+from .report_index import ReportIndex, build_report_index
 
 __all__ = [
     "create_regions_services_csv",
     "create_services_regions_matrix_csv",
+    "create_region_summary_csv",
+    "create_service_summary_csv",
     "create_json_output",
     "create_excel_output",
+    "ReportIndex",
+    "build_report_index",
 ]
@@ -6,9 +6,44 @@ Generates CSV reports showing regional service availability and services-regions
 import csv
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..core.config import Config
+from .report_index import ReportIndex, build_report_index
+
+# Buffer size for CSV files so rows are flushed in a few large writes
+# rather than thousands of default 8 KiB ones
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Characters that force a field to be quoted under csv.QUOTE_MINIMAL
+_CSV_SPECIAL_CHARS = (",", '"', "\r", "\n")
+
+# Header lines for the summary reports, terminated like csv.writer rows
+_REGION_SUMMARY_HEADER = (
+    "Region Code,Region Name,Launch Date,Launch Date Source,"
+    "Announcement URL,Availability Zones,Service Count\r\n"
+)
+_SERVICE_SUMMARY_HEADER = "Service Code,Service Name,Region Count,Coverage %\r\n"
+
+
+def _csv_field(value: Any) -> str:
+    """Format a single CSV field the way csv.writer's default dialect does.
+
+    Args:
+        value: Field value; None becomes an empty field and other non-string
+            values are converted with str()
+
+    Returns:
+        The field text, wrapped in double quotes with embedded quotes doubled
+        when it contains a delimiter, quote, or line break
+    """
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        value = str(value)
+    if any(char in value for char in _CSV_SPECIAL_CHARS):
+        return '"' + value.replace('"', '""') + '"'
+    return value
 
 
 def create_regions_services_csv(
@@ -18,6 +53,7 @@ def create_regions_services_csv(
     service_names: Dict[str, str] = None,
     enhanced_services: Dict[str, Dict[str, Dict[str, Any]]] = None,
     quiet: bool = False,
+    index: Optional[ReportIndex] = None,
 ) -> None:
     """Generate CSV file listing all regions and their available services.
 
@@ -28,6 +64,7 @@ def create_regions_services_csv(
         service_names: Dictionary mapping service codes to display names
         enhanced_services: Dictionary with enhanced service metadata per region
         quiet: Suppress progress output if True
+        index: Precomputed ReportIndex; built from the data when omitted
 
     Creates:
         CSV file with columns: Region Code, Region Name, Service Code, Service Name, Status, Availability
@@ -42,28 +79,35 @@ def create_regions_services_csv(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
+    # Resolve the optional name mapping once instead of per row
+    display_names = service_names or {}
+    if index is None:
+        index = build_report_index(regions, region_services)
+
+    with open(
+        output_path,
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=CSV_WRITE_BUFFER_SIZE,
+    ) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["Region Code", "Region Name", "Service Code", "Service Name"])
 
         # Write data sorted by region code
-        for region_code in sorted(regions.keys()):
+        for region_code in index.sorted_region_codes:
             region_name = regions[region_code]["name"]
-            services = sorted(region_services.get(region_code, []))
+            services = index.region_services_sorted.get(region_code, [])
 
             for service_code in services:
-                service_name = (
-                    service_names.get(service_code, service_code)
-                    if service_names
-                    else service_code
-                )
+                service_name = display_names.get(service_code, service_code)
 
                 writer.writerow([region_code, region_name, service_code, service_name])
 
     if not quiet:
-        total_rows = sum(len(services) for services in region_services.values())
         print(
-            f"    ✓ Created {config.regions_filename} ({total_rows:,} service entries)"
+            f"    ✓ Created {config.regions_filename} "
+            f"({index.total_entries:,} service entries)"
         )
 
     logger.info(f"Created {config.regions_filename} with {len(regions)} regions")
@@ -75,6 +119,7 @@ def create_services_regions_matrix_csv(
     region_services: Dict[str, List[str]],
     service_names: Dict[str, str] = None,
     quiet: bool = False,
+    index: Optional[ReportIndex] = None,
 ) -> None:
     """Generate CSV matrix showing service availability across regions.
 
@@ -84,6 +129,7 @@ def create_services_regions_matrix_csv(
         region_services: Dictionary mapping region codes to service lists
         service_names: Dictionary mapping service codes to display names
         quiet: Suppress progress output if True
+        index: Precomputed ReportIndex; built from the data when omitted
 
     Creates:
         CSV file with services (using full names) as rows and regions as columns
@@ -98,37 +144,38 @@ def create_services_regions_matrix_csv(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Get all unique services and sort them
-    all_service_codes = sorted(
-        set().union(*region_services.values()) if region_services else []
+    # Resolve the optional name mapping once instead of per row
+    display_names = service_names or {}
+
+    if index is None:
+        index = build_report_index(regions, region_services)
+    all_service_codes = index.sorted_service_codes
+    sorted_regions = index.sorted_region_codes
+
+    # Start every cell as unavailable and mark only the (service, region)
+    # pairs that exist, so the work scales with actual availability entries
+    # rather than with services × regions
+    service_index = {code: i for i, code in enumerate(all_service_codes)}
+    matrix_rows = [[b"0"] * len(sorted_regions) for _ in all_service_codes]
+    for column, region_code in enumerate(sorted_regions):
+        for service_code in region_services.get(region_code, ()):
+            matrix_rows[service_index[service_code]][column] = b"1"
+
+    # Cells are only "0"/"1", so rows are joined directly instead of going
+    # through csv.writer field by field; the output (including csv's \r\n
+    # line terminator) is identical. Names are encoded to UTF-8 once and
+    # rows are assembled as bytes, skipping the text layer's per-write encode
+    header_bytes = b",".join(
+        _csv_field(h).encode("utf-8") for h in ["Service", *sorted_regions]
     )
-
-    # Get sorted region codes
-    sorted_regions = sorted(regions.keys())
-
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-
-        # Write header
-        header = ["Service"] + sorted_regions
-        writer.writerow(header)
-
-        # Write matrix data
-        for service_code in all_service_codes:
-            # Use full service name if available, otherwise use service code
-            service_display = (
-                service_names.get(service_code, service_code)
-                if service_names
-                else service_code
-            )
-            row = [service_display]
-            for region_code in sorted_regions:
-                # Check if service is available in this region
-                available = (
-                    "1" if service_code in region_services.get(region_code, []) else "0"
-                )
-                row.append(available)
-            writer.writerow(row)
+    service_bytes = [
+        _csv_field(display_names.get(code, code)).encode("utf-8")
+        for code in all_service_codes
+    ]
+    with open(output_path, "wb", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+        csvfile.write(header_bytes + b"\r\n")
+        for name, cells in zip(service_bytes, matrix_rows):
+            csvfile.write(b",".join([name, *cells]) + b"\r\n")
 
     if not quiet:
         print(
@@ -145,6 +192,7 @@ def create_region_summary_csv(
     regions: Dict[str, Dict[str, Any]],
     region_services: Dict[str, List[str]],
     quiet: bool = False,
+    index: Optional[ReportIndex] = None,
 ) -> None:
     """Generate CSV file summarizing regions with comprehensive details.
 
@@ -153,6 +201,7 @@ def create_region_summary_csv(
         regions: Dictionary mapping region codes to region details dictionaries
         region_services: Dictionary mapping region codes to service lists
         quiet: Suppress progress output if True
+        index: Precomputed ReportIndex; built from the data when omitted
 
     Creates:
         CSV file with columns: Region Code, Region Name, Launch Date, Launch Date Source,
@@ -168,22 +217,22 @@ def create_region_summary_csv(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(
-            [
-                "Region Code",
-                "Region Name",
-                "Launch Date",
-                "Launch Date Source",
-                "Announcement URL",
-                "Availability Zones",
-                "Service Count",
-            ]
-        )
+    if index is None:
+        index = build_report_index(regions, region_services)
+
+    with open(
+        output_path,
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=CSV_WRITE_BUFFER_SIZE,
+    ) as csvfile:
+        # Rows are formatted directly rather than through csv.writer; text
+        # fields go through _csv_field so the output is byte-identical
+        csvfile.write(_REGION_SUMMARY_HEADER)
 
         # Write data sorted by region code
-        for region_code in sorted(regions.keys()):
+        for region_code in index.sorted_region_codes:
             region_details = regions[region_code]
             region_name = region_details["name"]
             launch_date = region_details.get("launch_date", "Unknown")
@@ -192,22 +241,16 @@ def create_region_summary_csv(
             service_count = len(region_services.get(region_code, []))
             az_count = region_details.get("az_count", 0)
 
-            writer.writerow(
-                [
-                    region_code,
-                    region_name,
-                    launch_date,
-                    launch_date_source,
-                    announcement_url,
-                    az_count,
-                    service_count,
-                ]
+            csvfile.write(
+                f"{_csv_field(region_code)},{_csv_field(region_name)},"
+                f"{_csv_field(launch_date)},{_csv_field(launch_date_source)},"
+                f"{_csv_field(announcement_url)},{_csv_field(az_count)},"
+                f"{service_count}\r\n"
             )
 
     if not quiet:
         total_regions = len(regions)
-        total_services = sum(len(services) for services in region_services.values())
-        avg_services = total_services / total_regions if total_regions > 0 else 0
+        avg_services = index.total_entries / total_regions if total_regions > 0 else 0
         print(
             f"    ✓ Created region_summary.csv ({total_regions:,} regions, "
             f"avg {avg_services:.1f} services per region)"
@@ -222,6 +265,7 @@ def create_service_summary_csv(
     region_services: Dict[str, List[str]],
     service_names: Dict[str, str] = None,
     quiet: bool = False,
+    index: Optional[ReportIndex] = None,
 ) -> None:
     """Generate CSV file summarizing services with regional coverage statistics.
 
@@ -231,6 +275,7 @@ def create_service_summary_csv(
         region_services: Dictionary mapping region codes to service lists
         service_names: Dictionary mapping service codes to display names
         quiet: Suppress progress output if True
+        index: Precomputed ReportIndex; built from the data when omitted
 
     Creates:
         CSV file with columns: Service Code, Service Name, Region Count, Coverage %
@@ -245,48 +290,44 @@ def create_service_summary_csv(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Get all unique services and calculate their coverage
-    all_service_codes = sorted(
-        set().union(*region_services.values()) if region_services else []
-    )
+    # Resolve the optional name mapping once instead of per row
+    display_names = service_names or {}
+
+    if index is None:
+        index = build_report_index(regions, region_services)
+    all_service_codes = index.sorted_service_codes
+    region_counts = index.service_region_counts
     total_regions = len(regions)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["Service Code", "Service Name", "Region Count", "Coverage %"])
+    with open(
+        output_path,
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=CSV_WRITE_BUFFER_SIZE,
+    ) as csvfile:
+        # Rows are formatted directly rather than through csv.writer; text
+        # fields go through _csv_field so the output is byte-identical
+        csvfile.write(_SERVICE_SUMMARY_HEADER)
 
         # Write data sorted by service code
         for service_code in all_service_codes:
-            service_name = (
-                service_names.get(service_code, service_code)
-                if service_names
-                else service_code
-            )
+            service_name = display_names.get(service_code, service_code)
 
-            # Count how many regions have this service
-            available_regions = [
-                region_code
-                for region_code, services in region_services.items()
-                if service_code in services
-            ]
-            region_count = len(available_regions)
+            region_count = region_counts[service_code]
             coverage_percent = (
                 (region_count / total_regions * 100) if total_regions > 0 else 0
             )
 
-            writer.writerow(
-                [
-                    service_code,
-                    service_name,
-                    region_count,
-                    f"{coverage_percent:.1f}",
-                ]
+            csvfile.write(
+                f"{_csv_field(service_code)},{_csv_field(service_name)},"
+                f"{region_count},{coverage_percent:.1f}\r\n"
             )
 
     if not quiet:
         print(
             f"    ✓ Created service_summary.csv ({len(all_service_codes):,} services, "
-            f"avg {sum(len(services) for services in region_services.values()) / len(all_service_codes):.1f} regions per service)"
+            f"avg {index.total_entries / len(all_service_codes):.1f} regions per service)"
         )
 
     logger.info(f"Created service_summary.csv with {len(all_service_codes)} services")
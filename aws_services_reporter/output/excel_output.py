@@ -4,11 +4,57 @@ Generates Excel workbooks with multiple formatted sheets containing regional ser
 """
 
 import logging
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..core.config import Config
+from .report_index import ReportIndex, build_report_index
+
+
+def _header_cells(ws: Any, headers: List[str], font: Any, fill: Any) -> List[Any]:
+    """Build styled write-only header cells for a sheet.
+
+    Args:
+        ws: Write-only worksheet the cells belong to
+        headers: Header labels
+        font: Font applied to every header cell
+        fill: Fill applied to every header cell
+
+    Returns:
+        List of WriteOnlyCell objects ready to append as the first row
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = font
+        cell.fill = fill
+        cells.append(cell)
+    return cells
+
+
+def _set_column_widths(ws: Any, rows: List[List[Any]]) -> None:
+    """Size each column of a sheet to fit its longest value, capped at 50.
+
+    Args:
+        ws: Worksheet to size; for write-only sheets this must run before
+            any rows are appended
+        rows: All rows the sheet will contain, including the header
+    """
+    from openpyxl.utils import get_column_letter
+
+    max_lengths: Dict[int, int] = defaultdict(int)
+    for row in rows:
+        for col_idx, value in enumerate(row, start=1):
+            max_lengths[col_idx] = max(
+                max_lengths[col_idx], len(str(value)) if value else 0
+            )
+
+    for col_idx, max_length in max_lengths.items():
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
 
 
 def create_excel_output(
@@ -19,6 +65,7 @@ def create_excel_output(
     enhanced_services: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
     metadata: Optional[Dict[str, Any]] = None,
     quiet: bool = False,
+    index: Optional[ReportIndex] = None,
 ) -> bool:
     """Generate Excel workbook with multiple formatted sheets.
 
@@ -30,6 +77,7 @@ def create_excel_output(
         enhanced_services: Dictionary with enhanced service metadata per region
         metadata: Optional metadata about the data fetch operation
         quiet: Suppress progress output if True
+        index: Precomputed ReportIndex; built from the data when omitted
 
     Returns:
         True if Excel file was successfully created, False if dependencies missing or error occurred
@@ -52,28 +100,48 @@ def create_excel_output(
 
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Alignment, Font, PatternFill
 
         if not quiet:
             print("  📝 Creating Excel output...")
 
-        # Prepare data for Excel sheets
-        all_service_codes = sorted(
-            set().union(*region_services.values()) if region_services else []
-        )
+        # Sort regions and each region's services and count regional coverage
+        # once, shared by every sheet below
+        if index is None:
+            index = build_report_index(regions, region_services)
+        sorted_regions = index.sorted_region_codes
+        all_service_codes = index.sorted_service_codes
+        region_counts = index.service_region_counts
 
-        # Create workbook
-        wb = Workbook()
+        # Create a write-only workbook: rows are streamed to the sheet XML as
+        # they are appended instead of being kept as full Cell objects, so
+        # styles and column widths are set before each sheet's rows are added
+        wb = Workbook(write_only=True)
 
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Style objects are created once and shared by every cell using them
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(
+            start_color="366092", end_color="366092", fill_type="solid"
+        )
+        green_fill = PatternFill(
+            start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
+        )
+        red_fill = PatternFill(
+            start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
+        )
+        section_font = Font(bold=True, size=12)
+        section_fill = PatternFill(
+            start_color="D9D9D9", end_color="D9D9D9", fill_type="solid"
+        )
+        right_align = Alignment(horizontal="right")
 
         # Sheet 1: Regional Services
         ws_regional = wb.create_sheet("Regional Services")
         regional_data = []
-        for region_code in sorted(regions.keys()):
+        for region_code in sorted_regions:
             region_name = regions[region_code]["name"]
-            services = sorted(region_services.get(region_code, []))
+            services = index.region_services_sorted.get(region_code, [])
             for service_code in services:
                 service_name = (
                     service_names.get(service_code, service_code)
@@ -92,28 +160,26 @@ def create_excel_output(
             "Service Code",
             "Service Name",
         ]
-        ws_regional.append(headers)
+        _set_column_widths(ws_regional, [headers, *regional_data])
+        ws_regional.append(
+            _header_cells(ws_regional, headers, header_font, header_fill)
+        )
         for row in regional_data:
             ws_regional.append(row)
 
-        # Format headers
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid"
-        )
-        for cell in ws_regional[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-
         # Sheet 2: Service Matrix
         ws_matrix = wb.create_sheet("Service Matrix")
-        sorted_regions = sorted(regions.keys())
 
-        # Create matrix header
-        matrix_header = ["Service"] + sorted_regions
-        ws_matrix.append(matrix_header)
+        # Index each region's services once so every membership test is a set
+        # lookup rather than a scan of the region's service list
+        region_sets = [
+            frozenset(region_services.get(region_code, ()))
+            for region_code in sorted_regions
+        ]
 
         # Create matrix data with full service names
+        matrix_header = ["Service"] + sorted_regions
+        matrix_data = []
         for service_code in all_service_codes:
             # Use full service name if available, otherwise use service code
             service_display = (
@@ -121,40 +187,41 @@ def create_excel_output(
                 if service_names
                 else service_code
             )
-            row = [service_display]
-            for region_code in sorted_regions:
-                available = (
-                    "✓" if service_code in region_services.get(region_code, []) else "✗"
-                )
-                row.append(available)
-            ws_matrix.append(row)
-
-        # Format matrix headers
-        for cell in ws_matrix[1]:
-            cell.font = header_font
-            cell.fill = header_fill
+            matrix_data.append(
+                [
+                    service_display,
+                    *[
+                        "✓" if service_code in services else "✗"
+                        for services in region_sets
+                    ],
+                ]
+            )
 
-        # Format availability indicators
-        green_fill = PatternFill(
-            start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
-        )
-        red_fill = PatternFill(
-            start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
+        # Availability cells are a single glyph, never wider than the region
+        # code heading their column, so only the header and the service name
+        # column need measuring
+        _set_column_widths(
+            ws_matrix, [matrix_header, *([row[0]] for row in matrix_data)]
         )
 
-        for row in ws_matrix.iter_rows(min_row=2):
-            for cell in row[1:]:  # Skip service name column
-                if cell.value == "✓":
-                    cell.fill = green_fill
-                elif cell.value == "✗":
-                    cell.fill = red_fill
+        # Availability indicators are colored as the cells are created
+        ws_matrix.append(
+            _header_cells(ws_matrix, matrix_header, header_font, header_fill)
+        )
+        for service_display, *availability in matrix_data:
+            row = [service_display]
+            for available in availability:
+                cell = WriteOnlyCell(ws_matrix, value=available)
+                cell.fill = green_fill if available == "✓" else red_fill
+                row.append(cell)
+            ws_matrix.append(row)
 
         # Sheet 3: Region Summary
         ws_summary = wb.create_sheet("Region Summary")
 
         # Create region summary data with enhanced details including launch dates
         summary_data = []
-        for region_code in sorted(regions.keys()):
+        for region_code in sorted_regions:
             region_details = regions[region_code]
             region_name = region_details["name"]
             launch_date = region_details.get("launch_date", "Unknown")
@@ -185,31 +252,21 @@ def create_excel_output(
             "Availability Zones",
             "Service Count",
         ]
-        ws_summary.append(summary_headers)
+        _set_column_widths(ws_summary, [summary_headers, *summary_data])
+        ws_summary.append(
+            _header_cells(ws_summary, summary_headers, header_font, header_fill)
+        )
         for row in summary_data:
+            # Right-align the 5th and 6th columns
+            for col_idx in (4, 5):
+                cell = WriteOnlyCell(ws_summary, value=row[col_idx])
+                cell.alignment = right_align
+                row[col_idx] = cell
             ws_summary.append(row)
 
-        # Format summary headers
-        for cell in ws_summary[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-
-        # Format numeric columns with number formatting
-        for row_idx in range(2, len(summary_data) + 2):
-            # AZ count column (5th column)
-            az_cell = ws_summary.cell(row=row_idx, column=5)
-            az_cell.alignment = Alignment(horizontal="right")
-            # Service count column (6th column)
-            service_cell = ws_summary.cell(row=row_idx, column=6)
-            service_cell.alignment = Alignment(horizontal="right")
-
         # Sheet 4: Service Summary
         ws_service_summary = wb.create_sheet("Service Summary")
 
-        # Get all unique services and calculate their coverage
-        all_service_codes = sorted(
-            set().union(*region_services.values()) if region_services else []
-        )
         total_regions = len(regions)
 
         # Create service summary data
@@ -221,13 +278,7 @@ def create_excel_output(
                 else service_code
             )
 
-            # Count how many regions have this service
-            available_regions = [
-                region_code
-                for region_code, services in region_services.items()
-                if service_code in services
-            ]
-            region_count = len(available_regions)
+            region_count = region_counts[service_code]
             coverage_percent = (
                 (region_count / total_regions * 100) if total_regions > 0 else 0
             )
@@ -248,48 +299,39 @@ def create_excel_output(
             "Region Count",
             "Coverage %",
         ]
-        ws_service_summary.append(service_summary_headers)
+        _set_column_widths(
+            ws_service_summary, [service_summary_headers, *service_summary_data]
+        )
+        ws_service_summary.append(
+            _header_cells(
+                ws_service_summary, service_summary_headers, header_font, header_fill
+            )
+        )
         for row in service_summary_data:
+            # Right-align the region count and coverage % columns
+            for col_idx in (2, 3):
+                cell = WriteOnlyCell(ws_service_summary, value=row[col_idx])
+                cell.alignment = right_align
+                row[col_idx] = cell
             ws_service_summary.append(row)
 
-        # Format service summary headers
-        for cell in ws_service_summary[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-
-        # Format numeric columns with right alignment
-        for row_idx in range(2, len(service_summary_data) + 2):
-            # Region count column (3rd column)
-            region_count_cell = ws_service_summary.cell(row=row_idx, column=3)
-            region_count_cell.alignment = Alignment(horizontal="right")
-            # Coverage % column (4th column)
-            coverage_cell = ws_service_summary.cell(row=row_idx, column=4)
-            coverage_cell.alignment = Alignment(horizontal="right")
-
         # Sheet 5: Statistics
         ws_stats = wb.create_sheet("Statistics")
 
         # Calculate statistics
-        total_service_instances = sum(
-            len(services) for services in region_services.values()
-        )
+        total_service_instances = index.total_entries
         avg_services = total_service_instances / len(regions) if regions else 0
 
         # Most/least available services
         service_coverage = {}
         for service_code in all_service_codes:
-            available_regions = [
-                region
-                for region, services in region_services.items()
-                if service_code in services
-            ]
             # Use full name if available for display
             service_display = (
                 service_names.get(service_code, service_code)
                 if service_names
                 else service_code
             )
-            service_coverage[service_display] = len(available_regions)
+            service_coverage[service_display] = region_counts[service_code]
 
         most_available = (
             max(service_coverage.keys(), key=lambda x: service_coverage[x])
@@ -335,37 +377,19 @@ def create_excel_output(
                 ]
             )
 
+        _set_column_widths(ws_stats, stats_data)
         for row_data in stats_data:
+            # Format section headings
+            if row_data[0] in ["Summary Statistics", "Fetch Metadata"]:
+                section_cells = []
+                for value in row_data:
+                    cell = WriteOnlyCell(ws_stats, value=value)
+                    cell.font = section_font
+                    cell.fill = section_fill
+                    section_cells.append(cell)
+                row_data = section_cells
             ws_stats.append(row_data)
 
-        # Format statistics sheet
-        for row in ws_stats.iter_rows():
-            if row[0].value in ["Summary Statistics", "Fetch Metadata"]:
-                for cell in row:
-                    cell.font = Font(bold=True, size=12)
-                    cell.fill = PatternFill(
-                        start_color="D9D9D9",
-                        end_color="D9D9D9",
-                        fill_type="solid",
-                    )
-
-        # Auto-adjust column widths
-        for ws in [
-            ws_regional,
-            ws_matrix,
-            ws_summary,
-            ws_service_summary,
-            ws_stats,
-        ]:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -6,15 +6,45 @@ Generates comprehensive JSON reports with statistics, metadata, and structured d
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..core.config import Config
+from .report_index import ReportIndex, build_report_index
 
+# Use orjson for faster report serialization when it is installed
+try:
+    import orjson
 
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _dumps_report(data: Dict[str, Any]) -> bytes:
+    """Serialize report data to indented, key-sorted UTF-8 JSON bytes.
+
+    Uses orjson when available and the standard library otherwise; both emit
+    the same two-space indented layout with non-ASCII characters unescaped.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True).encode(
+        "utf-8"
+    )
+
+
+@lru_cache(maxsize=16)
 def _get_region_status(partition: str) -> str:
     """Get human-readable status from partition.
 
+    Cached because there are only a handful of partitions across all regions.
+
     Args:
         partition: AWS partition (e.g., 'aws', 'aws-gov', 'aws-cn')
 
@@ -43,6 +73,7 @@ def create_json_output(
     enhanced_services: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
     metadata: Optional[Dict[str, Any]] = None,
     quiet: bool = False,
+    index: Optional[ReportIndex] = None,
 ) -> bool:
     """Generate comprehensive JSON output with statistics and metadata.
 
@@ -54,6 +85,7 @@ def create_json_output(
         enhanced_services: Dictionary with enhanced service metadata per region
         metadata: Optional metadata about the data fetch operation
         quiet: Suppress progress output if True
+        index: Precomputed ReportIndex; built from the data when omitted
 
     Returns:
         True if JSON file was successfully created, False otherwise
@@ -72,33 +104,28 @@ def create_json_output(
     if not quiet:
         print("  📝 Creating JSON output...")
 
-    # Prepare comprehensive data structure
-    all_services = sorted(
-        set().union(*region_services.values()) if region_services else []
-    )
+    # Resolve the optional name mapping once instead of per service
+    display_names = service_names or {}
+
+    # Sort regions and each region's services once for the whole report
+    if index is None:
+        index = build_report_index(regions, region_services)
+    all_services = index.sorted_service_codes
 
     # Calculate statistics with full service names
     service_stats = {}
     for service_code in all_services:
-        available_regions = [
-            region
-            for region, services in region_services.items()
-            if service_code in services
-        ]
+        available_regions = index.service_regions_sorted[service_code]
         coverage_pct = (len(available_regions) / len(regions)) * 100 if regions else 0
 
         # Use full service name as key if available
-        service_key = (
-            service_names.get(service_code, service_code)
-            if service_names
-            else service_code
-        )
+        service_key = display_names.get(service_code, service_code)
 
         service_stats[service_key] = {
             "service_code": service_code,
             "available_in": len(available_regions),
             "coverage_percentage": round(coverage_pct, 1),
-            "regions": sorted(available_regions),
+            "regions": available_regions,
         }
 
     # Find most/least available services
@@ -115,11 +142,38 @@ def create_json_output(
         most_available = least_available = None
 
     # Calculate average services per region
-    total_service_instances = sum(
-        len(services) for services in region_services.values()
-    )
+    total_service_instances = index.total_entries
     avg_services = total_service_instances / len(regions) if regions else 0
 
+    # Build per-region details, reading each region's launch date once
+    regions_data = {}
+    for region_code in index.sorted_region_codes:
+        region_details = regions[region_code]
+        launch_date = region_details.get("launch_date", "Unknown")
+        partition = region_details.get("partition", "Unknown")
+        services = index.region_services_sorted.get(region_code, [])
+        regions_data[region_code] = {
+            "name": region_details["name"],
+            "launch_date": launch_date,
+            "launch_year": (
+                launch_date.split("-", 1)[0] if launch_date != "Unknown" else "Unknown"
+            ),
+            "launch_date_source": region_details.get("launch_date_source", "Unknown"),
+            "formatted_date": region_details.get("formatted_date", ""),
+            "announcement_url": region_details.get("announcement_url", ""),
+            "status": _get_region_status(partition),
+            "partition": partition,
+            "availability_zones": region_details.get("az_count", 0),
+            "service_count": len(services),
+            "services": [
+                {
+                    "code": service_code,
+                    "name": display_names.get(service_code, service_code),
+                }
+                for service_code in services
+            ],
+        }
+
     # Build comprehensive JSON structure
     json_data = {
         "generated_at": datetime.now().isoformat(),
@@ -136,40 +190,7 @@ def create_json_output(
             "most_available_service": most_available,
             "least_available_service": least_available,
         },
-        "regions": {
-            region_code: {
-                "name": region_details["name"],
-                "launch_date": region_details.get("launch_date", "Unknown"),
-                "launch_year": (
-                    region_details.get("launch_date", "Unknown").split("-")[0]
-                    if region_details.get("launch_date", "Unknown") != "Unknown"
-                    else "Unknown"
-                ),
-                "launch_date_source": region_details.get(
-                    "launch_date_source", "Unknown"
-                ),
-                "formatted_date": region_details.get("formatted_date", ""),
-                "announcement_url": region_details.get("announcement_url", ""),
-                "status": _get_region_status(
-                    region_details.get("partition", "Unknown")
-                ),
-                "partition": region_details.get("partition", "Unknown"),
-                "availability_zones": region_details.get("az_count", 0),
-                "service_count": len(region_services.get(region_code, [])),
-                "services": [
-                    {
-                        "code": service_code,
-                        "name": (
-                            service_names.get(service_code, service_code)
-                            if service_names
-                            else service_code
-                        ),
-                    }
-                    for service_code in sorted(region_services.get(region_code, []))
-                ],
-            }
-            for region_code, region_details in sorted(regions.items())
-        },
+        "regions": regions_data,
         "services": service_stats,
         "metadata": metadata or {},
     }
@@ -179,8 +200,7 @@ def create_json_output(
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write JSON file with pretty formatting
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        output_path.write_bytes(_dumps_report(json_data))
 
         # Get file size for both display and logging
         file_size = output_path.stat().st_size
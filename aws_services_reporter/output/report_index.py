@@ -0,0 +1,71 @@
+"""Shared report index for AWS Services Reporter output generators.
+
+Sorts and counts the region/service data once so the CSV, JSON, and Excel
+writers do not each repeat the work.
+"""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass(frozen=True)
+class ReportIndex:
+    """Sorted views of the report data shared by the output generators.
+
+    Attributes:
+        sorted_region_codes: Region codes in sorted order
+        sorted_service_codes: Unique service codes across all regions, sorted
+        region_services_sorted: Region code to its sorted service list
+        service_regions_sorted: Service code to the sorted list of regions
+            offering it
+        service_region_counts: Service code to the number of regions offering it
+        total_entries: Total number of (region, service) availability entries
+    """
+
+    sorted_region_codes: List[str]
+    sorted_service_codes: List[str]
+    region_services_sorted: Dict[str, List[str]]
+    service_regions_sorted: Dict[str, List[str]]
+    service_region_counts: Counter
+    total_entries: int
+
+
+def build_report_index(
+    regions: Dict[str, Dict[str, Any]], region_services: Dict[str, List[str]]
+) -> ReportIndex:
+    """Sort and count the report data once for reuse across output generators.
+
+    Args:
+        regions: Dictionary mapping region codes to region details dictionaries
+        region_services: Dictionary mapping region codes to service lists
+
+    Returns:
+        ReportIndex built from the given data
+    """
+    region_services_sorted = {
+        region_code: sorted(services)
+        for region_code, services in region_services.items()
+    }
+
+    # Invert the mapping in one pass; walking regions in sorted order leaves
+    # each service's region list already sorted
+    service_regions_sorted: Dict[str, List[str]] = defaultdict(list)
+    for region_code in sorted(region_services):
+        for service_code in region_services[region_code]:
+            service_regions_sorted[service_code].append(region_code)
+    service_region_counts = Counter(
+        {
+            service_code: len(region_codes)
+            for service_code, region_codes in service_regions_sorted.items()
+        }
+    )
+
+    return ReportIndex(
+        sorted_region_codes=sorted(regions.keys()),
+        sorted_service_codes=sorted(service_region_counts),
+        region_services_sorted=region_services_sorted,
+        service_regions_sorted=dict(service_regions_sorted),
+        service_region_counts=service_region_counts,
+        total_entries=sum(service_region_counts.values()),
+    )
@@ -107,6 +107,11 @@ Examples:
         default=10,
         help="Number of concurrent API calls (default: 10)",
     )
+    parser.add_argument(
+        "--map-by-service",
+        action="store_true",
+        help="List regions per service instead of services per region (slower, ~10x more API calls)",
+    )
 
     # Caching system
     parser.add_argument(
@@ -127,8 +132,8 @@ Examples:
     )
     parser.add_argument(
         "--cache-file",
-        default="cache/aws_data_cache.json",
-        help="Cache file name (default: cache/aws_data_cache.json)",
+        default="cache/aws_data_cache.json.gz",
+        help="Cache file name (default: cache/aws_data_cache.json.gz)",
     )
     parser.add_argument(
         "--cache-stats",
@@ -257,7 +262,7 @@ On first run, it fetches data (~90 seconds) and saves it.
 Subsequent runs load from cache (~5 seconds) - 99% time savings!
 
 📁 CACHE FILE:
-• Default: aws_data_cache.json (in output directory)
+• Default: aws_data_cache.json.gz (in output directory)
 • Contains: regions, services, timestamps, metadata
 • Format: JSON with validation and version info
 • Auto-created and managed
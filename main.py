@@ -10,12 +10,13 @@ This refactored version uses the new modular structure for better code organizat
 import time
 from pathlib import Path
 
+from aws_services_reporter.aws_client.rss_client import clear_rss_cache
 from aws_services_reporter.aws_client.session import create_session
 from aws_services_reporter.aws_client.ssm_client import (
+    build_enhanced_services,
     get_all_regions_and_names,
     get_all_services_with_names,
     get_services_per_region,
-    get_services_per_region_enhanced,
 )
 from aws_services_reporter.core.cache import AWSDataCache
 
@@ -30,6 +31,7 @@ from aws_services_reporter.output.csv_output import (
 )
 from aws_services_reporter.output.excel_output import create_excel_output
 from aws_services_reporter.output.json_output import create_json_output
+from aws_services_reporter.output.report_index import build_report_index
 from aws_services_reporter.plugins.base import plugin_registry
 from aws_services_reporter.plugins.utils import (
     initialize_plugins,
@@ -116,7 +118,10 @@ def main() -> None:
         return
 
     if getattr(args, "clear_cache", False):
-        if cache.clear():
+        # Clear both caches even if one fails, then report any failure
+        cleared = cache.clear()
+        cleared = clear_rss_cache(config) and cleared
+        if cleared:
             progress.print_status("✅ Cache cleared successfully", "green")
         else:
             progress.print_status("❌ Failed to clear cache", "red")
@@ -149,13 +154,15 @@ def main() -> None:
 
             # Fetch regions, services, and service names
             regions = get_all_regions_and_names(config, session, quiet)
-            region_services = get_services_per_region(config, session, quiet)
+            region_services = get_services_per_region(
+                config, session, quiet, region_codes=regions.keys()
+            )
             service_names = get_all_services_with_names(config, session, quiet)
 
-            # Conditionally fetch enhanced metadata
+            # Conditionally build enhanced metadata from the data fetched above
             if config.enhanced_metadata:
-                enhanced_services = get_services_per_region_enhanced(
-                    config, session, quiet
+                enhanced_services = build_enhanced_services(
+                    region_services, service_names, quiet
                 )
             else:
                 if not quiet:
@@ -243,7 +250,10 @@ def main() -> None:
 
         output_success = []
 
-        # Generate requested formats
+        # Sort and count the data once for every output writer
+        report_index = build_report_index(regions, region_services)
+
+        # Generate requested formats in the order given
         for format_type in config.output_formats:
             if format_type == "csv":
                 create_regions_services_csv(
@@ -253,12 +263,35 @@ def main() -> None:
                     service_names,
                     enhanced_services,
                     quiet,
+                    index=report_index,
                 )
                 create_services_regions_matrix_csv(
-                    config, regions, region_services, service_names, quiet
+                    config,
+                    regions,
+                    region_services,
+                    service_names,
+                    quiet,
+                    index=report_index,
                 )
                 output_success.append("CSV")
 
+            elif format_type == "region-summary":
+                create_region_summary_csv(
+                    config, regions, region_services, quiet, index=report_index
+                )
+                output_success.append("Region Summary")
+
+            elif format_type == "service-summary":
+                create_service_summary_csv(
+                    config,
+                    regions,
+                    region_services,
+                    service_names,
+                    quiet,
+                    index=report_index,
+                )
+                output_success.append("Service Summary")
+
             elif format_type == "json":
                 if create_json_output(
                     config,
@@ -268,6 +301,7 @@ def main() -> None:
                     enhanced_services,
                     metadata,
                     quiet,
+                    index=report_index,
                 ):
                     output_success.append("JSON")
 
@@ -280,19 +314,10 @@ def main() -> None:
                     enhanced_services,
                     metadata,
                     quiet,
+                    index=report_index,
                 ):
                     output_success.append("Excel")
 
-            elif format_type == "region-summary":
-                create_region_summary_csv(config, regions, region_services, quiet)
-                output_success.append("Region Summary")
-
-            elif format_type == "service-summary":
-                create_service_summary_csv(
-                    config, regions, region_services, service_names, quiet
-                )
-                output_success.append("Service Summary")
-
             else:
                 # Check if it's a plugin format
                 if is_plugin_format(format_type):
@@ -10,16 +10,32 @@ from moto import mock_aws
 
 # Import functions to test
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from aws_services_reporter.aws_client.session import create_session
+from aws_services_reporter.aws_client.session import _make_session, create_session
 from aws_services_reporter.aws_client.ssm_client import (
+    _build_client_config,
+    _create_ssm_client,
+    build_enhanced_services,
     get_all_parameters_by_path,
     get_all_regions_and_names,
+    get_all_services_with_names,
     get_region_details,
+    get_service_name,
+    get_service_names,
     get_services_per_region,
+    get_services_per_region_enhanced,
 )
 from aws_services_reporter.core.config import Config
 
 
+def _mock_ssm_client() -> MagicMock:
+    """Build a mock SSM client whose paginator pages through get_parameters_by_path."""
+    ssm = MagicMock()
+    ssm.get_paginator.return_value.paginate.side_effect = lambda **kwargs: iter(
+        [ssm.get_parameters_by_path(Path=kwargs["Path"])]
+    )
+    return ssm
+
+
 @mock_aws
 class TestAWSIntegration:
     """Test AWS integration with mocked services."""
@@ -87,17 +103,21 @@ class TestAWSIntegration:
         # Patch the function to use test paths
         import unittest.mock
 
-        with unittest.mock.patch.object(self.ssm, "get_parameter") as mock_get:
-            # Mock responses for different API calls
-            def mock_parameter_response(Name):
-                if "longName" in Name:
-                    return {"Parameter": {"Value": "US East (N. Virginia)"}}
-                elif "launchDate" in Name:
-                    return {"Parameter": {"Value": "2006-08-25"}}
-                elif "partition" in Name:
-                    return {"Parameter": {"Value": "aws"}}
-                else:
-                    raise Exception("Parameter not found")
+        with unittest.mock.patch.object(self.ssm, "get_parameters") as mock_get:
+            # Mock batched response for name, launch date, and partition
+            def mock_parameter_response(Names):
+                values = {
+                    "longName": "US East (N. Virginia)",
+                    "launchDate": "2006-08-25",
+                    "partition": "aws",
+                }
+                return {
+                    "Parameters": [
+                        {"Name": name, "Value": values[name.rsplit("/", 1)[-1]]}
+                        for name in Names
+                    ],
+                    "InvalidParameters": [],
+                }
 
             mock_get.side_effect = mock_parameter_response
 
@@ -117,6 +137,7 @@ class TestAWSIntegration:
                 assert details["launch_date"] == "2006-08-25"
                 assert details["partition"] == "aws"
                 assert details["az_count"] == 3
+                mock_get.assert_called_once()
 
     def test_get_region_details_error_handling(self):
         """Test region details fetching with non-existent region."""
@@ -129,6 +150,18 @@ class TestAWSIntegration:
         assert details["partition"] == "Unknown"
         assert details["az_count"] == 0
 
+    def test_max_retries_keyword_still_accepted(self):
+        """Test the legacy max_retries keyword is accepted and ignored."""
+        params = get_all_parameters_by_path(
+            self.ssm, "/test/infrastructure/regions", max_retries=5
+        )
+        assert len(params) == len(self.test_regions)
+
+        details = get_region_details(self.ssm, "non-existent-region", max_retries=5)
+        assert details["code"] == "non-existent-region"
+
+        assert get_service_name(self.ssm, "unknown", max_retries=5) == "unknown"
+
     @pytest.mark.skip(
         reason="These functions use real AWS parameter paths - need integration environment"
     )
@@ -185,50 +218,69 @@ class TestAWSIntegration:
     def test_create_session_with_profile(self):
         """Test session creation with AWS profile."""
         config = Config(aws_profile="test-profile")
+        _make_session.cache_clear()
 
         with patch("boto3.Session") as mock_session:
             create_session(config)
             mock_session.assert_called_once_with(profile_name="test-profile")
+        _make_session.cache_clear()
 
     def test_create_session_without_profile(self):
         """Test session creation without AWS profile."""
         config = Config(aws_profile=None)
+        _make_session.cache_clear()
 
         with patch("boto3.Session") as mock_session:
             create_session(config)
             mock_session.assert_called_once_with()
+        _make_session.cache_clear()
+
+    def test_create_session_is_cached(self):
+        """Test repeated session creation reuses the cached session."""
+        config = Config(aws_profile="test-profile")
+        _make_session.cache_clear()
+
+        with patch("boto3.Session") as mock_session:
+            first = create_session(config)
+            second = create_session(config)
+            assert first is second
+            mock_session.assert_called_once_with(profile_name="test-profile")
+        _make_session.cache_clear()
 
 
 class TestErrorHandling:
     """Test error handling scenarios."""
 
-    def test_retry_mechanism(self):
-        """Test retry mechanism with simulated throttling."""
-        mock_ssm = MagicMock()
+    def test_retry_configuration(self):
+        """Test throttling retries are delegated to botocore adaptive mode."""
+        config = Config(max_retries=5)
 
-        # Simulate throttling then success
-        from botocore.exceptions import ClientError
+        client_config = _build_client_config(config)
 
-        throttling_error = ClientError(
-            error_response={"Error": {"Code": "Throttling"}},
-            operation_name="GetParametersByPath",
-        )
+        assert client_config.retries == {
+            "total_max_attempts": 5,
+            "mode": "adaptive",
+        }
 
-        mock_ssm.get_parameters_by_path.side_effect = [
-            throttling_error,
-            throttling_error,
-            {"Parameters": [{"Name": "test", "Value": "value"}], "NextToken": None},
-        ]
+    def test_connection_pool_matches_workers(self):
+        """Test connection pool is sized to the worker count."""
+        assert _build_client_config(Config(max_workers=25)).max_pool_connections == 25
+        assert _build_client_config(Config(max_workers=2)).max_pool_connections == 10
+
+    def test_clients_created_with_retry_configuration(self):
+        """Test SSM clients are created with the retry configuration."""
+        session = MagicMock()
+        config = Config(max_retries=4, aws_region="eu-west-1")
+
+        _create_ssm_client(session, config)
 
-        # Should eventually succeed after retries
-        with patch("time.sleep"):  # Speed up test by mocking sleep
-            result = get_all_parameters_by_path(mock_ssm, "/test/path", max_retries=3)
-            assert len(result) == 1
-            assert mock_ssm.get_parameters_by_path.call_count == 3
+        _, kwargs = session.client.call_args
+        assert kwargs["region_name"] == "eu-west-1"
+        assert kwargs["config"].retries["total_max_attempts"] == 4
 
     def test_non_retryable_error(self):
         """Test handling of non-retryable errors."""
-        mock_ssm = MagicMock()
+        mock_ssm = _mock_ssm_client()
 
         from botocore.exceptions import ClientError
 
@@ -241,7 +293,189 @@ class TestErrorHandling:
 
         # Should raise immediately for non-retryable errors
         with pytest.raises(ClientError):
-            get_all_parameters_by_path(mock_ssm, "/test/path", max_retries=3)
+            get_all_parameters_by_path(mock_ssm, "/test/path")
+        assert mock_ssm.get_parameters_by_path.call_count == 1
+
+
+class TestClientReuse:
+    """Test SSM client sharing and call batching across worker tasks."""
+
+    def test_workers_share_one_client(self):
+        """Test concurrent fetches send every request through one SSM client."""
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = lambda **kwargs: {"Parameters": []}
+        session = MagicMock()
+        session.client.return_value = ssm
+        service_params = [{"Value": f"svc{i}"} for i in range(40)]
+
+        get_all_services_with_names(
+            Config(max_workers=4), session, quiet=True, service_params=service_params
+        )
+
+        assert session.client.call_count == 1
+        assert ssm.get_parameters.call_count == 4
+
+    def test_enhanced_lists_services_once(self):
+        """Test the enhanced mapping lists service codes with a single crawl."""
+        regions_by_service = {"ec2": ["us-east-1", "eu-west-1"], "s3": ["us-east-1"]}
+
+        def get_parameters_by_path(**kwargs):
+            path = kwargs["Path"]
+            if path.endswith("/services"):
+                return {"Parameters": [{"Value": code} for code in regions_by_service]}
+            service_code = path.split("/")[-2]
+            return {
+                "Parameters": [
+                    {"Value": region} for region in regions_by_service[service_code]
+                ]
+            }
+
+        ssm = _mock_ssm_client()
+        ssm.get_parameters_by_path.side_effect = get_parameters_by_path
+        ssm.get_parameters.side_effect = lambda **kwargs: {
+            "Parameters": [
+                {"Name": name, "Value": name.split("/")[-2].upper()}
+                for name in kwargs["Names"]
+            ]
+        }
+        session = MagicMock()
+        session.client.return_value = ssm
+
+        enhanced = get_services_per_region_enhanced(
+            Config(services_by_region=False), session, quiet=True
+        )
+
+        listing_calls = [
+            c
+            for c in ssm.get_parameters_by_path.call_args_list
+            if c.kwargs["Path"].endswith("/services")
+        ]
+        assert len(listing_calls) == 1
+        assert enhanced["us-east-1"]["s3"]["name"] == "S3"
+        assert set(enhanced["eu-west-1"]) == {"ec2"}
+
+    def test_services_mapped_by_region(self):
+        """Test the default mapping lists services once per region."""
+        services_by_region = {"us-east-1": ["ec2", "s3"], "eu-west-1": ["ec2"]}
+
+        def get_parameters_by_path(**kwargs):
+            path = kwargs["Path"]
+            if path.endswith("/regions"):
+                return {"Parameters": [{"Value": code} for code in services_by_region]}
+            region_code = path.split("/")[-2]
+            return {
+                "Parameters": [
+                    {"Value": code} for code in services_by_region[region_code]
+                ]
+            }
+
+        ssm = _mock_ssm_client()
+        ssm.get_parameters_by_path.side_effect = get_parameters_by_path
+        session = MagicMock()
+        session.client.return_value = ssm
+
+        region_services = get_services_per_region(Config(), session, quiet=True)
+
+        assert region_services == services_by_region
+        assert ssm.get_parameters_by_path.call_count == 3
+
+        # Region codes the caller already fetched are not listed again
+        ssm.get_parameters_by_path.reset_mock()
+        region_services = get_services_per_region(
+            Config(), session, quiet=True, region_codes=services_by_region.keys()
+        )
+
+        assert region_services == services_by_region
+        assert ssm.get_parameters_by_path.call_count == 2
+
+    def test_build_enhanced_services(self):
+        """Test enhanced metadata is built from already-fetched data."""
+        enhanced = build_enhanced_services(
+            {"us-east-1": ["ec2", "s3"], "eu-west-1": ["ec2"]},
+            {"ec2": "Amazon EC2"},
+            quiet=True,
+        )
+
+        assert enhanced["us-east-1"]["ec2"] == {
+            "name": "Amazon EC2",
+            "status": "available",
+        }
+        # Services without a display name fall back to their code
+        assert enhanced["us-east-1"]["s3"]["name"] == "s3"
+        assert list(enhanced["eu-west-1"]) == ["ec2"]
+
+    def test_region_details_batched(self):
+        """Test region details are fetched in GetParameters batches of 10."""
+        region_codes = [f"region-{i}" for i in range(7)]
+
+        ssm = _mock_ssm_client()
+        ssm.get_parameters_by_path.side_effect = lambda **kwargs: {
+            "Parameters": (
+                [{"Value": code} for code in region_codes]
+                if kwargs["Path"].endswith("/regions")
+                else [{"Value": "az1"}, {"Value": "az2"}]
+            )
+        }
+        ssm.get_parameters.side_effect = lambda **kwargs: {
+            "Parameters": [
+                {"Name": name, "Value": f"value of {name.rsplit('/', 2)[-2]}"}
+                for name in kwargs["Names"]
+            ]
+        }
+        session = MagicMock()
+        session.client.return_value = ssm
+
+        with patch(
+            "aws_services_reporter.aws_client.ssm_client.get_rss_region_launch_dates",
+            return_value={},
+        ):
+            regions = get_all_regions_and_names(Config(), session, quiet=True)
+
+        # 7 regions x 3 detail parameters = 21 names -> 3 batched calls
+        assert ssm.get_parameters.call_count == 3
+        assert set(regions) == set(region_codes)
+        assert regions["region-6"]["name"] == "value of region-6"
+        assert regions["region-6"]["partition"] == "value of region-6"
+        assert regions["region-6"]["az_count"] == 2
+
+    def test_service_names_batched(self):
+        """Test service names are fetched in GetParameters batches of 10."""
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = lambda **kwargs: {
+            "Parameters": [
+                {"Name": name, "Value": f"Service {name.split('/')[-2]}"}
+                for name in kwargs["Names"][1:]
+            ],
+            "InvalidParameters": kwargs["Names"][:1],
+        }
+        session = MagicMock()
+        session.client.return_value = ssm
+        service_params = [{"Value": f"svc{i}"} for i in range(25)]
+
+        names = get_all_services_with_names(
+            Config(), session, quiet=True, service_params=service_params
+        )
+
+        assert ssm.get_parameters.call_count == 3
+        assert (
+            max(len(c.kwargs["Names"]) for c in ssm.get_parameters.call_args_list) == 10
+        )
+        assert len(names) == 25
+        assert list(names) == sorted(names)
+        # Invalid parameters fall back to the service code
+        assert names["svc0"] == "svc0"
+        assert names["svc1"] == "Service svc1"
+
+    def test_get_service_names_error_fallback(self):
+        """Test a failed batch falls back to service codes."""
+        from botocore.exceptions import ClientError
+
+        ssm = MagicMock()
+        ssm.get_parameters.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "GetParameters"
+        )
+
+        assert get_service_names(ssm, ["ec2", "s3"]) == {"ec2": "ec2", "s3": "s3"}
 
 
 if __name__ == "__main__":
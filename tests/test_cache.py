@@ -1,5 +1,6 @@
 """Tests for AWS data caching functionality."""
 
+import gzip
 import json
 import os
 
@@ -13,6 +14,7 @@ from unittest.mock import mock_open, patch
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from aws_services_reporter.core import cache as cache_module
 from aws_services_reporter.core.cache import AWSDataCache
 from aws_services_reporter.core.config import Config
 
@@ -110,6 +112,72 @@ class TestAWSDataCache:
         assert loaded_data["region_services"] == self.test_region_services
         assert loaded_data["metadata"] == self.test_metadata
 
+    def test_cache_load_includes_service_names(self):
+        """Test warm loads return everything needed to skip SSM entirely."""
+        service_names = {"ec2": "Amazon EC2", "s3": "Amazon S3"}
+        enhanced_services = {"us-east-1": {"ec2": {"name": "Amazon EC2"}}}
+        self.cache.save(
+            self.test_regions,
+            self.test_region_services,
+            service_names,
+            enhanced_services,
+        )
+        loaded_data = self.cache.load()
+
+        assert loaded_data["service_names"] == service_names
+        assert loaded_data["enhanced_services"] == enhanced_services
+
+    def test_cache_load_reads_file_once(self):
+        """Test a cache hit parses the cache file a single time."""
+        self.cache.save(self.test_regions, self.test_region_services)
+
+        with patch(
+            "aws_services_reporter.core.cache._loads", side_effect=cache_module._loads
+        ) as mock_load:
+            loaded_data = self.cache.load()
+
+        assert loaded_data["regions"] == self.test_regions
+        assert mock_load.call_count == 1
+
+    def test_cache_stdlib_json_fallback(self):
+        """Test the cache round-trips without orjson installed."""
+        with patch("aws_services_reporter.core.cache.ORJSON_AVAILABLE", False):
+            self.cache.save(self.test_regions, self.test_region_services)
+            loaded_data = self.cache.load()
+
+        assert loaded_data["regions"] == self.test_regions
+
+    def test_compressed_cache_round_trip(self):
+        """Test a .gz cache file is written gzip-compressed and reads back."""
+        gz_file = Path(self.temp_dir) / "test_cache.json.gz"
+        cache = AWSDataCache(str(gz_file), cache_hours=24)
+
+        try:
+            cache.save(self.test_regions, self.test_region_services)
+
+            with gzip.open(gz_file, "rb") as f:
+                assert json.loads(f.read())["regions"] == self.test_regions
+            assert cache.load()["region_services"] == self.test_region_services
+
+            # A file that is not valid gzip is treated as corrupted
+            gz_file.write_text("invalid gzip content")
+            assert cache.load() is None
+        finally:
+            gz_file.unlink()
+
+    def test_failed_save_keeps_previous_cache(self):
+        """Test an interrupted save leaves the existing cache file intact."""
+        self.cache.save(self.test_regions, self.test_region_services)
+
+        with patch(
+            "aws_services_reporter.core.cache._dumps",
+            side_effect=RuntimeError("interrupted"),
+        ):
+            assert self.cache.save({}, {}) is False
+
+        assert self.cache.load()["regions"] == self.test_regions
+        assert list(Path(self.temp_dir).iterdir()) == [self.cache_file]
+
     def test_cache_load_invalid(self):
         """Test loading data from invalid cache."""
         # Create expired cache
@@ -174,7 +242,8 @@ class TestAWSDataCache:
         assert cache_info["version"] == "1.4.1"
         assert cache_info["total_regions"] == len(self.test_regions)
         assert cache_info["total_services"] == 3  # ec2, s3, lambda
-        assert "cache_file_size" in cache_info
+        # File size is reported from disk by get_stats rather than stored
+        assert self.cache.get_stats()["file_size"] == self.cache_file.stat().st_size
 
 
 if __name__ == "__main__":
@@ -34,7 +34,7 @@ class TestConfig:
         assert config.max_retries == 3
         assert config.cache_enabled is True
         assert config.cache_hours == 24
-        assert config.cache_file == "cache/aws_data_cache.json"
+        assert config.cache_file == "cache/aws_data_cache.json.gz"
         assert config.use_rich is True
         assert config.output_formats is None
 
@@ -58,6 +58,15 @@ class TestConfig:
         assert config.cache_hours == 48
         assert config.output_formats == ["json", "excel"]
 
+    def test_config_is_frozen(self):
+        """Test configuration cannot be mutated after construction."""
+        from dataclasses import FrozenInstanceError
+
+        config = Config()
+
+        with pytest.raises(FrozenInstanceError):
+            config.max_workers = 20
+
 
 class TestArgumentParsing:
     """Test command-line argument parsing."""
@@ -74,7 +83,7 @@ class TestArgumentParsing:
             assert args.max_retries == 3
             assert args.no_cache is False
             assert args.cache_hours == 24
-            assert args.cache_file == "cache/aws_data_cache.json"
+            assert args.cache_file == "cache/aws_data_cache.json.gz"
             assert args.format == ["csv"]
             assert args.profile is None
             assert args.region == "us-east-1"
@@ -299,7 +308,7 @@ class TestHelpFunctions:
 
         # Should contain all cache concepts
         assert "TTL" in cache_help_output
-        assert "aws_data_cache.json" in cache_help_output
+        assert "aws_data_cache.json.gz" in cache_help_output
         assert "--clear-cache" in cache_help_output
         assert "--no-cache" in cache_help_output
 
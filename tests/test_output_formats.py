@@ -1,6 +1,7 @@
 """Tests for output format generation (CSV, JSON, Excel)."""
 
 import csv
+import io
 import json
 import os
 import sys
@@ -16,10 +17,12 @@ from aws_services_reporter.core.config import Config
 from aws_services_reporter.output.csv_output import (
     create_region_summary_csv,
     create_regions_services_csv,
+    create_service_summary_csv,
     create_services_regions_matrix_csv,
 )
 from aws_services_reporter.output.excel_output import create_excel_output
 from aws_services_reporter.output.json_output import create_json_output
+from aws_services_reporter.output.report_index import build_report_index
 
 
 class TestOutputFormats:
@@ -153,6 +156,170 @@ class TestOutputFormats:
         assert service_matrix["lambda"]["eu-west-1"] == "0"
         assert service_matrix["lambda"]["ap-southeast-1"] == "0"
 
+    def test_matrix_csv_matches_csv_module_output(self):
+        """Test the direct matrix writer produces exactly what csv.writer would."""
+        service_names = {"ec2": 'Amazon "EC2", Compute', "s3": "Amazon S3"}
+        create_services_regions_matrix_csv(
+            self.config,
+            self.test_regions,
+            self.test_region_services,
+            service_names,
+            quiet=True,
+        )
+
+        csv_file = Path(self.temp_dir) / "csv" / "test_matrix.csv"
+        with open(csv_file, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+            f.seek(0)
+            written = f.read()
+
+        expected = io.StringIO()
+        csv.writer(expected).writerows(rows)
+        assert written == expected.getvalue()
+        assert rows[1][0] == 'Amazon "EC2", Compute'
+
+    def test_summary_csvs_match_csv_module_output(self):
+        """Test the direct summary writers produce exactly what csv.writer would."""
+        regions = dict(self.test_regions)
+        regions["us-east-1"] = {**regions["us-east-1"], "name": 'US "East", Virginia'}
+        create_region_summary_csv(
+            self.config, regions, self.test_region_services, quiet=True
+        )
+        create_service_summary_csv(
+            self.config,
+            regions,
+            self.test_region_services,
+            {"ec2": 'Amazon "EC2", Compute'},
+            quiet=True,
+        )
+
+        for filename in ("region_summary.csv", "service_summary.csv"):
+            csv_file = Path(self.temp_dir) / "csv" / filename
+            with open(csv_file, "r", newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+                f.seek(0)
+                written = f.read()
+
+            expected = io.StringIO()
+            csv.writer(expected).writerows(rows)
+            assert written == expected.getvalue()
+
+    def test_csvs_match_csv_module_for_non_str_fields(self):
+        """Test None and non-string fields are written like csv.writer."""
+        regions = dict(self.test_regions)
+        regions["us-east-1"] = {
+            **regions["us-east-1"],
+            "launch_date": None,
+            "announcement_url": None,
+            "az_count": None,
+            "launch_date_source": 2006,
+        }
+        create_region_summary_csv(
+            self.config, regions, self.test_region_services, quiet=True
+        )
+
+        csv_file = Path(self.temp_dir) / "csv" / "region_summary.csv"
+        written = csv_file.read_bytes().decode("utf-8")
+
+        expected = io.StringIO()
+        writer = csv.writer(expected)
+        writer.writerow(
+            [
+                "Region Code",
+                "Region Name",
+                "Launch Date",
+                "Launch Date Source",
+                "Announcement URL",
+                "Availability Zones",
+                "Service Count",
+            ]
+        )
+        for code in sorted(regions):
+            details = regions[code]
+            writer.writerow(
+                [
+                    code,
+                    details["name"],
+                    details.get("launch_date", "Unknown"),
+                    details.get("launch_date_source", "Unknown"),
+                    details.get("announcement_url", ""),
+                    details.get("az_count", 0),
+                    len(self.test_region_services.get(code, [])),
+                ]
+            )
+        assert written == expected.getvalue()
+        assert "us-east-1,US East (N. Virginia),,2006,,,3\r\n" in written
+
+        # Matrix header and service name cells use the same field formatting
+        create_services_regions_matrix_csv(
+            self.config,
+            regions,
+            self.test_region_services,
+            {"ec2": None, "s3": 3, "lambda": 'AWS "Lambda", Functions'},
+            quiet=True,
+        )
+        matrix_file = Path(self.temp_dir) / "csv" / "test_matrix.csv"
+        written = matrix_file.read_bytes().decode("utf-8")
+
+        expected = io.StringIO()
+        writer = csv.writer(expected)
+        sorted_regions = sorted(regions)
+        writer.writerow(["Service", *sorted_regions])
+        names = {"ec2": None, "s3": 3, "lambda": 'AWS "Lambda", Functions'}
+        for code in sorted(names):
+            writer.writerow(
+                [
+                    names[code],
+                    *[
+                        "1" if code in self.test_region_services[r] else "0"
+                        for r in sorted_regions
+                    ],
+                ]
+            )
+        assert written == expected.getvalue()
+
+    def test_build_report_index(self):
+        """Test the shared CSV index sorts and counts the data once."""
+        index = build_report_index(self.test_regions, self.test_region_services)
+
+        assert index.sorted_region_codes == sorted(self.test_regions)
+        assert index.sorted_service_codes == sorted(
+            {s for services in self.test_region_services.values() for s in services}
+        )
+        assert index.total_entries == sum(
+            len(services) for services in self.test_region_services.values()
+        )
+        for region_code, services in self.test_region_services.items():
+            assert index.region_services_sorted[region_code] == sorted(services)
+        assert index.service_regions_sorted["s3"] == ["eu-west-1", "us-east-1"]
+        assert index.service_region_counts["ec2"] == 3
+
+    def test_writers_reuse_supplied_index(self):
+        """Test JSON and Excel writers use a supplied index instead of rebuilding."""
+        index = build_report_index(self.test_regions, self.test_region_services)
+        with patch(
+            "aws_services_reporter.output.json_output.build_report_index"
+        ) as json_build, patch(
+            "aws_services_reporter.output.excel_output.build_report_index"
+        ) as excel_build:
+            assert create_json_output(
+                self.config,
+                self.test_regions,
+                self.test_region_services,
+                quiet=True,
+                index=index,
+            )
+            create_excel_output(
+                self.config,
+                self.test_regions,
+                self.test_region_services,
+                quiet=True,
+                index=index,
+            )
+
+        json_build.assert_not_called()
+        excel_build.assert_not_called()
+
     def test_create_region_summary_csv(self):
         """Test CSV region summary output generation."""
         create_region_summary_csv(
@@ -265,6 +432,24 @@ class TestOutputFormats:
         assert services_data["lambda"]["available_in"] == 1
         assert services_data["lambda"]["coverage_percentage"] == 33.3
 
+    def test_json_output_stdlib_fallback(self):
+        """Test the JSON report is the same without orjson installed."""
+        create_json_output(
+            self.config, self.test_regions, self.test_region_services, quiet=True
+        )
+        json_file = Path(self.temp_dir) / "json" / "test_regions.json"
+        fast_data = json.loads(json_file.read_text(encoding="utf-8"))
+
+        with patch("aws_services_reporter.output.json_output.ORJSON_AVAILABLE", False):
+            create_json_output(
+                self.config, self.test_regions, self.test_region_services, quiet=True
+            )
+        stdlib_data = json.loads(json_file.read_text(encoding="utf-8"))
+
+        fast_data.pop("generated_at")
+        stdlib_data.pop("generated_at")
+        assert fast_data == stdlib_data
+
     def test_create_excel_output_success(self):
         """Test Excel output generation (when dependencies available)."""
         # Test the real Excel functionality if dependencies are available
@@ -336,6 +521,24 @@ class TestOutputFormats:
             )
             assert result is False
 
+    def test_excel_matrix_cells_styled_when_written(self):
+        """Test availability cells are colored in the streamed matrix sheet."""
+        openpyxl = pytest.importorskip("openpyxl")
+
+        assert create_excel_output(
+            self.config, self.test_regions, self.test_region_services, quiet=True
+        )
+
+        wb = openpyxl.load_workbook(Path(self.temp_dir) / "excel" / "test_regions.xlsx")
+        ws_matrix = wb["Service Matrix"]
+        for row in ws_matrix.iter_rows(min_row=2):
+            for cell in row[1:]:
+                expected = "00C6EFCE" if cell.value == "✓" else "00FFC7CE"
+                assert cell.fill.fgColor.rgb == expected
+        assert ws_matrix["A1"].font.b
+        assert ws_matrix.column_dimensions["A"].width > 2
+        wb.close()
+
     def test_create_excel_output_missing_dependencies(self):
         """Test Excel output when dependencies are missing."""
         # Test when pandas import fails
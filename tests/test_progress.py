@@ -0,0 +1,96 @@
+"""Tests for progress tracking and console output."""
+
+import io
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from aws_services_reporter.core.progress import ProgressTracker
+
+
+class TestProgressTracker:
+    """Test cases for ProgressTracker."""
+
+    def _rich_tracker(self) -> ProgressTracker:
+        """Build a Rich tracker whose console writes to a string buffer."""
+        tracker = ProgressTracker(use_rich=True)
+        if not tracker.use_rich:
+            pytest.skip("rich is not installed")
+        tracker.console = tracker._rich.Console(file=io.StringIO(), width=60)
+        return tracker
+
+    def test_print_table_rich_single_write(self):
+        """Test a Rich table is rendered off-screen and written once."""
+        tracker = self._rich_tracker()
+        expected = tracker._rich.Console(file=io.StringIO(), width=60)
+        table = tracker._rich.Table(title="Regions")
+        table.add_column("Code")
+        table.add_row("us-east-1")
+        expected.print(table)
+
+        file = MagicMock(wraps=tracker.console.file)
+        tracker.console.file = file
+        tracker.print_table([["us-east-1"]], ["Code"], title="Regions")
+
+        file.write.assert_called_once_with(expected.file.getvalue())
+
+    def test_print_table_rich_during_progress(self):
+        """Test a table printed during a live progress display goes via the console."""
+        tracker = self._rich_tracker()
+        tracker.current_progress = (MagicMock(), 1)
+
+        with patch.object(tracker.console, "print") as console_print:
+            tracker.print_table([["us-east-1"]], ["Code"])
+
+        console_print.assert_called_once()
+
+    def test_update_progress_batches_until_total(self):
+        """Test batched advances are applied in chunks and flushed at the total."""
+        tracker = self._rich_tracker()
+        total = 1001
+        progress, task_id = tracker.start_operation("Fetching", total=total)
+        assert tracker._update_batch_size == total // 200
+
+        with patch.object(progress, "update", wraps=progress.update) as update:
+            for _ in range(total):
+                tracker.update_progress()
+
+        task = progress.tasks[task_id]
+        assert task.completed == total
+        assert update.call_count == total // tracker._update_batch_size + 1
+
+        tracker.finish_operation()
+        assert task.completed == total
+        assert tracker.current_progress is None
+
+    def test_finish_operation_flushes_pending_advance(self):
+        """Test finishing an operation applies advances still below a batch."""
+        tracker = self._rich_tracker()
+        progress, task_id = tracker.start_operation("Fetching")
+
+        for _ in range(3):
+            tracker.update_progress()
+        assert progress.tasks[task_id].completed == 0
+
+        tracker.finish_operation()
+        assert progress.tasks[task_id].completed == 3
+
+    def test_print_table_plain(self, capsys):
+        """Test the non-Rich fallback renders the table with tabulate."""
+        tracker = ProgressTracker(use_rich=False)
+
+        tracker.print_table([["us-east-1", 42]], ["Code", "Services"], title="Regions")
+
+        out = capsys.readouterr().out
+        assert out.startswith("\nRegions\n")
+        assert "| Code      |   Services |" in out
+        assert "| us-east-1 |         42 |" in out
+
+    def test_print_table_quiet(self, capsys):
+        """Test quiet mode prints nothing."""
+        ProgressTracker(quiet=True).print_table([["us-east-1"]], ["Code"])
+
+        assert capsys.readouterr().out == ""
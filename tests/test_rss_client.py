@@ -1,11 +1,21 @@
 """Tests for RSS client functionality."""
 
+import json
+import shutil
+import tempfile
 import unittest
 import xml.etree.ElementTree as ET
-from unittest.mock import mock_open, patch
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, mock_open, patch
 
 from aws_services_reporter.aws_client.rss_client import (
+    RSS_CACHE_FILENAME,
+    clear_rss_cache,
+    close_rss_session,
     extract_region_code_from_description,
+    fetch_rss_data,
+    fetch_rss_feed,
     get_rss_region_launch_dates,
     merge_launch_date_sources,
     parse_rss_launch_dates,
@@ -16,6 +26,30 @@ from aws_services_reporter.core.config import Config
 class TestRSSClient(unittest.TestCase):
     """Test cases for RSS client functionality."""
 
+    def setUp(self):
+        """Set up an isolated output directory for RSS cache files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = Config(output_dir=self.temp_dir)
+        self.rss_cache_file = Path(self.temp_dir) / "cache" / RSS_CACHE_FILENAME
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _feed_response(
+        data="<rss>mock data</rss>", status=200, max_age=None, no_store=False
+    ):
+        """Build a fetch_rss_feed response dictionary."""
+        return {
+            "status": status,
+            "data": data,
+            "etag": '"v1"',
+            "last_modified": "Fri, 25 Aug 2006 12:00:00 GMT",
+            "max_age": max_age,
+            "no_store": no_store,
+        }
+
     def test_extract_region_code_from_description(self):
         """Test region code extraction from RSS descriptions."""
         # Test standard region format
@@ -126,6 +160,57 @@ class TestRSSClient(unittest.TestCase):
         self.assertIn("us-east-1", result)
         self.assertEqual(result["us-east-1"]["launch_date"], "Unknown")
 
+    def test_parse_rss_launch_dates_numeric_timezone(self):
+        """Test RSS parsing with numeric timezone offsets."""
+        sample_rss = """<?xml version="1.0" encoding="UTF-8"?>
+        <rss version="2.0">
+            <channel>
+                <item>
+                    <title>Asia Pacific (Sydney)</title>
+                    <description>AWS region ap-southeast-2 launch</description>
+                    <link>https://aws.amazon.com/blogs/aws/ap-southeast-2</link>
+                    <pubDate>Tue, 12 Nov 2012 18:00:00 -0800</pubDate>
+                </item>
+            </channel>
+        </rss>"""
+
+        result = parse_rss_launch_dates(sample_rss)
+
+        self.assertEqual(result["ap-southeast-2"]["launch_date"], "2012-11-12")
+
+    def test_parse_rss_launch_dates_bytes(self):
+        """Test RSS parsing directly from fetched response bytes."""
+        sample_rss = (
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b"<rss><channel><item>"
+            b"<title>Europe (Ireland)</title>"
+            b"<description>AWS region eu-west-1 launch</description>"
+            b"<pubDate>Mon, 10 Dec 2007 15:30:00 GMT</pubDate>"
+            b"</item></channel></rss>"
+        )
+
+        result = parse_rss_launch_dates(sample_rss)
+
+        self.assertEqual(result["eu-west-1"]["launch_date"], "2007-12-10")
+        self.assertEqual(result["eu-west-1"]["announcement_url"], "")
+
+    def test_parse_rss_launch_dates_iso_date(self):
+        """Test RSS parsing falls back to ISO 8601 publication dates."""
+        sample_rss = """<?xml version="1.0" encoding="UTF-8"?>
+        <rss version="2.0">
+            <channel>
+                <item>
+                    <title>Europe (Spain)</title>
+                    <description>AWS region eu-south-2 launch</description>
+                    <pubDate>2022-11-16T09:00:00+00:00</pubDate>
+                </item>
+            </channel>
+        </rss>"""
+
+        result = parse_rss_launch_dates(sample_rss)
+
+        self.assertEqual(result["eu-south-2"]["launch_date"], "2022-11-16")
+
     def test_merge_launch_date_sources_rss_priority(self):
         """Test that RSS data takes priority when merging sources."""
         ssm_date = "2006-08-20"
@@ -174,42 +259,245 @@ class TestRSSClient(unittest.TestCase):
         self.assertEqual(result["launch_date"], "2006-08-20")
         self.assertEqual(result["source"], "SSM")
 
-    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_data")
+    @patch("aws_services_reporter.aws_client.rss_client._SESSION")
+    def test_fetch_rss_data_uses_shared_session(self, mock_session):
+        """Test RSS fetching goes through the shared HTTP session."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"<rss></rss>"
+        mock_response.headers = {}
+        mock_session.get.return_value = mock_response
+
+        result = fetch_rss_data("https://example.com/feed.rss", timeout=5)
+
+        self.assertEqual(result, "<rss></rss>")
+        mock_session.get.assert_called_once_with(
+            "https://example.com/feed.rss", timeout=5, headers={}
+        )
+
+    @patch("aws_services_reporter.aws_client.rss_client._SESSION")
+    def test_fetch_rss_feed_cache_control(self, mock_session):
+        """Test Cache-Control max-age, no-cache and no-store are reported."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"<rss></rss>"
+        mock_session.get.return_value = mock_response
+
+        for cache_control, max_age, no_store in (
+            ("public, max-age=600", 600, False),
+            ("no-cache, max-age=600", 0, False),
+            ("no-store", None, True),
+            ("", None, False),
+        ):
+            mock_response.headers = {"Cache-Control": cache_control}
+            response = fetch_rss_feed("https://example.com/feed.rss")
+            self.assertEqual(response["max_age"], max_age, cache_control)
+            self.assertEqual(response["no_store"], no_store, cache_control)
+
+    def test_close_rss_session(self):
+        """Test closing the shared session releases it for a fresh one later."""
+        from aws_services_reporter.aws_client import rss_client
+
+        session = MagicMock()
+        with patch.object(rss_client, "_SESSION", session), patch.object(
+            rss_client, "_HTTP_RESOLVED", True
+        ):
+            close_rss_session()
+
+            session.close.assert_called_once()
+            self.assertIsNone(rss_client._SESSION)
+            self.assertFalse(rss_client._HTTP_RESOLVED)
+
+    @patch("aws_services_reporter.aws_client.rss_client._SESSION")
+    def test_fetch_rss_data_invalid_scheme(self, mock_session):
+        """Test RSS fetching rejects non-HTTP URLs without a request."""
+        self.assertIsNone(fetch_rss_data("file:///etc/passwd"))
+        self.assertIsNone(fetch_rss_data("https:/missing-host/feed.rss"))
+        mock_session.get.assert_not_called()
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
     @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
     def test_get_rss_region_launch_dates_success(self, mock_parse, mock_fetch):
         """Test successful RSS data retrieval."""
-        mock_fetch.return_value = "<rss>mock data</rss>"
+        mock_fetch.return_value = self._feed_response()
         mock_parse.return_value = {"us-east-1": {"launch_date": "2006-08-25"}}
 
-        config = Config()
-        result = get_rss_region_launch_dates(config)
+        result = get_rss_region_launch_dates(self.config)
 
         mock_fetch.assert_called_once()
         mock_parse.assert_called_once_with("<rss>mock data</rss>")
         self.assertEqual(result, {"us-east-1": {"launch_date": "2006-08-25"}})
 
-    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_data")
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
     def test_get_rss_region_launch_dates_fetch_failure(self, mock_fetch):
         """Test RSS data retrieval when fetch fails."""
         mock_fetch.return_value = None
 
-        config = Config()
-        result = get_rss_region_launch_dates(config)
+        result = get_rss_region_launch_dates(self.config)
 
         self.assertEqual(result, {})
 
-    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_data")
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
     @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
     def test_get_rss_region_launch_dates_parse_failure(self, mock_parse, mock_fetch):
         """Test RSS data retrieval when parsing fails."""
-        mock_fetch.return_value = "<rss>mock data</rss>"
+        mock_fetch.return_value = self._feed_response()
         mock_parse.side_effect = Exception("Parse error")
 
-        config = Config()
-        result = get_rss_region_launch_dates(config)
+        result = get_rss_region_launch_dates(self.config)
 
         self.assertEqual(result, {})
 
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
+    def test_get_rss_region_launch_dates_fresh_cache(self, mock_parse, mock_fetch):
+        """Test fresh RSS cache is used without any network access."""
+        mock_fetch.return_value = self._feed_response(max_age=3600)
+        mock_parse.return_value = {"us-east-1": {"launch_date": "2006-08-25"}}
+
+        first = get_rss_region_launch_dates(self.config)
+        second = get_rss_region_launch_dates(self.config)
+
+        self.assertEqual(first, second)
+        mock_fetch.assert_called_once()
+        mock_parse.assert_called_once()
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
+    def test_get_rss_region_launch_dates_not_modified(self, mock_parse, mock_fetch):
+        """Test stale RSS cache is revalidated and reused on 304."""
+        cached_regions = {"us-east-1": {"launch_date": "2006-08-25"}}
+        self.rss_cache_file.parent.mkdir(parents=True)
+        with open(self.rss_cache_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "etag": '"v1"',
+                    "last_modified": "Fri, 25 Aug 2006 12:00:00 GMT",
+                    "expires_at": (datetime.now() - timedelta(hours=1)).isoformat(),
+                    "regions_data": cached_regions,
+                },
+                f,
+            )
+        mock_fetch.return_value = self._feed_response(data="", status=304)
+
+        result = get_rss_region_launch_dates(self.config)
+
+        self.assertEqual(result, cached_regions)
+        mock_parse.assert_not_called()
+        _, kwargs = mock_fetch.call_args
+        self.assertEqual(kwargs["etag"], '"v1"')
+        self.assertEqual(kwargs["last_modified"], "Fri, 25 Aug 2006 12:00:00 GMT")
+
+    def _write_stale_cache(self, regions_data):
+        """Write an expired RSS cache entry to the test cache file."""
+        self.rss_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.rss_cache_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "etag": '"v1"',
+                    "last_modified": None,
+                    "expires_at": (datetime.now() - timedelta(hours=1)).isoformat(),
+                    "regions_data": regions_data,
+                },
+                f,
+            )
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
+    def test_get_rss_region_launch_dates_parse_failure_uses_stale_cache(
+        self, mock_parse, mock_fetch
+    ):
+        """Test stale cached results are returned when a new feed fails to parse."""
+        cached_regions = {"us-east-1": {"launch_date": "2006-08-25"}}
+        self._write_stale_cache(cached_regions)
+        mock_fetch.return_value = self._feed_response()
+        mock_parse.side_effect = Exception("Parse error")
+
+        result = get_rss_region_launch_dates(self.config)
+
+        self.assertEqual(result, cached_regions)
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
+    def test_get_rss_region_launch_dates_failed_save_keeps_cache(
+        self, mock_parse, mock_fetch
+    ):
+        """Test a failed cache write leaves the previous RSS cache intact."""
+        cached_regions = {"us-east-1": {"launch_date": "2006-08-25"}}
+        self._write_stale_cache(cached_regions)
+        mock_fetch.return_value = self._feed_response()
+        mock_parse.return_value = {"eu-west-1": {"launch_date": "2007-11-14"}}
+
+        with patch(
+            "aws_services_reporter.aws_client.rss_client.json.dump",
+            side_effect=OSError("disk full"),
+        ):
+            get_rss_region_launch_dates(self.config)
+
+        with open(self.rss_cache_file, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["regions_data"], cached_regions)
+        self.assertEqual(
+            list(self.rss_cache_file.parent.iterdir()), [self.rss_cache_file]
+        )
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
+    def test_get_rss_region_launch_dates_no_store(self, mock_parse, mock_fetch):
+        """Test a no-store response is returned but never written to the cache."""
+        mock_fetch.return_value = self._feed_response(max_age=3600, no_store=True)
+        mock_parse.return_value = {"us-east-1": {"launch_date": "2006-08-25"}}
+
+        result = get_rss_region_launch_dates(self.config)
+
+        self.assertEqual(result, {"us-east-1": {"launch_date": "2006-08-25"}})
+        self.assertFalse(self.rss_cache_file.exists())
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
+    def test_get_rss_region_launch_dates_no_cache(self, mock_parse, mock_fetch):
+        """Test a no-cache response is stored stale and revalidated on every run."""
+        mock_fetch.return_value = self._feed_response(max_age=0)
+        mock_parse.return_value = {"us-east-1": {"launch_date": "2006-08-25"}}
+
+        get_rss_region_launch_dates(self.config)
+        mock_fetch.return_value = self._feed_response(data="", status=304, max_age=0)
+        result = get_rss_region_launch_dates(self.config)
+
+        self.assertEqual(result, {"us-east-1": {"launch_date": "2006-08-25"}})
+        self.assertEqual(mock_fetch.call_count, 2)
+        _, kwargs = mock_fetch.call_args
+        self.assertEqual(kwargs["etag"], '"v1"')
+
+    def test_clear_rss_cache(self):
+        """Test the RSS cache file is removed and a missing file is not an error."""
+        self._write_stale_cache({})
+
+        self.assertTrue(clear_rss_cache(self.config))
+        self.assertFalse(self.rss_cache_file.exists())
+        self.assertTrue(clear_rss_cache(self.config))
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    @patch("aws_services_reporter.aws_client.rss_client.parse_rss_launch_dates")
+    def test_get_rss_region_launch_dates_empty_response(self, mock_parse, mock_fetch):
+        """Test an empty RSS response is not parsed or cached."""
+        mock_fetch.return_value = self._feed_response(data=b"")
+
+        result = get_rss_region_launch_dates(self.config)
+
+        self.assertEqual(result, {})
+        mock_parse.assert_not_called()
+        self.assertFalse(self.rss_cache_file.exists())
+
+    @patch("aws_services_reporter.aws_client.rss_client.fetch_rss_feed")
+    def test_get_rss_region_launch_dates_cache_disabled(self, mock_fetch):
+        """Test no RSS cache file is written when caching is disabled."""
+        mock_fetch.return_value = None
+        config = Config(output_dir=self.temp_dir, cache_enabled=False)
+
+        get_rss_region_launch_dates(config)
+
+        self.assertFalse(self.rss_cache_file.exists())
+
 
 if __name__ == "__main__":
     unittest.main()